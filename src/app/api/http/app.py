@@ -294,6 +294,7 @@ async def startup() -> None:
 
         logger.info("Setting up session storage and services")
         session_storage = await get_session_storage()
+        session_storage.start()
 
         logger.info("Creating OIDC client service")
         oidc_client_service = OidcClientService(jwt_verify_service)
@@ -322,6 +323,7 @@ async def startup() -> None:
             oidc_client_service=oidc_client_service,
             user_session_service=user_session_service,
             auth_session_service=auth_session_service,
+            session_storage=session_storage,
             database_service=database_service,
             redis_service=redis_service,
             temporal_service=temporal_service,
@@ -424,6 +426,10 @@ async def shutdown() -> None:
     # Clean up application-wide dependencies here
     await app_dependencies.auth_session_service.purge_expired()
     await app_dependencies.user_session_service.purge_expired()
+    await app_dependencies.session_storage.close()
+    # Close pooled OIDC provider and JWKS HTTP connections
+    await app_dependencies.oidc_client_service.close()
+    await app_dependencies.jwks_service.close()
     # Close Redis connection
     await app_dependencies.redis_service.close()
     # Close Temporal client connection
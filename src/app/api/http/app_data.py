@@ -12,6 +12,7 @@ from src.app.core.services import (
     TemporalClientService,
     UserSessionService,
 )
+from src.app.core.storage.session_storage import SessionStorage
 
 
 @dataclass
@@ -23,6 +24,7 @@ class ApplicationDependencies:
     oidc_client_service: OidcClientService
     user_session_service: UserSessionService
     auth_session_service: AuthSessionService
+    session_storage: SessionStorage
     database_service: DbSessionService
     redis_service: RedisService
     temporal_service: TemporalClientService
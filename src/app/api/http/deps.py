@@ -24,6 +24,7 @@ from src.app.core.services import (
 from src.app.entities.core.user import User, UserRepository
 from src.app.entities.core.user_identity.entity import UserIdentity
 from src.app.entities.core.user_identity.repository import UserIdentityRepository
+from src.app.runtime.config.config_data import DEV_ENVIRONMENTS
 from src.app.runtime.context import get_config
 
 
@@ -183,8 +184,12 @@ async def get_current_user(
     return user
 
 
+@lru_cache(maxsize=256)
 def require_scope(required_scope: str):
-    """Create a dependency that requires a specific scope for the authenticated user."""
+    """Create a dependency that requires a specific scope for the authenticated user.
+
+    Cached, so every route requiring the same scope shares one dependency.
+    """
 
     async def dep(request: Request) -> None:
         scopes: set[str] = getattr(request.state, "scopes", set())
@@ -196,8 +201,12 @@ def require_scope(required_scope: str):
     return dep
 
 
+@lru_cache(maxsize=256)
 def require_role(required_role: str):
-    """Create a dependency that requires a specific role for the authenticated user."""
+    """Create a dependency that requires a specific role for the authenticated user.
+
+    Cached, so every route requiring the same role shares one dependency.
+    """
 
     async def dep(request: Request) -> None:
         roles: set[str] = getattr(request.state, "roles", set())
@@ -477,7 +486,7 @@ def enforce_origin(request: Request) -> None:
 
     # 3) Skip enforcement in development mode
     cfg = get_config()
-    if cfg.app.environment == "development" or cfg.app.environment == "test":
+    if cfg.app.environment in DEV_ENVIRONMENTS:
         return
 
     allowed_origins = get_allowed_origins()  # normalized list of (scheme, host, port)
@@ -580,7 +589,7 @@ def require_csrf(request: Request) -> None:
 
     # 3) Skip enforcement in development mode
     cfg = get_config()
-    if cfg.app.environment == "development" or cfg.app.environment == "test":
+    if cfg.app.environment in DEV_ENVIRONMENTS:
         return
 
     csrf_header = request.headers.get("x-csrf-token")
@@ -42,15 +42,21 @@ class DefaultLocalRateLimiter:
     """Simple in-memory limiter used when Redis isn't available."""
 
     def __init__(
-        self, times: int, milliseconds: int, per_endpoint: bool, per_method: bool
+        self,
+        times: int,
+        milliseconds: int,
+        per_endpoint: bool,
+        per_method: bool,
+        time_func: Callable[[], float] = time.monotonic,
     ) -> None:
+        self._now = time_func
         self._hits: defaultdict[str, deque[float]] = defaultdict(deque)
         self._lock = asyncio.Lock()
         self._times = times
         self._seconds = milliseconds // 1000
         self._per_endpoint = per_endpoint
         self._per_method = per_method
-        self._last_cleanup = time.monotonic()
+        self._last_cleanup = self._now()
         self._cleanup_interval = 60.0  # seconds
 
     async def __call__(self, request: Request, response: Response) -> Any:
@@ -89,7 +95,7 @@ class DefaultLocalRateLimiter:
 
     async def _cleanup_old_keys(self) -> None:
         """Remove empty or very old key entries to prevent memory leaks."""
-        now = time.monotonic()
+        now = self._now()
         if now - self._last_cleanup < self._cleanup_interval:
             return
 
@@ -115,7 +121,7 @@ class DefaultLocalRateLimiter:
 
     async def _throttle(self, key: str, times: int, seconds: int) -> None:
         await self._cleanup_old_keys()  # Add periodic cleanup
-        now = time.monotonic()
+        now = self._now()
         window_start = now - seconds
         async with self._lock:
             hits = self._hits[key]
@@ -0,0 +1,72 @@
+"""Coarse wall clock for hot-path expiry checks.
+
+A daemon thread refreshes a whole-second timestamp once per tick, so session
+lookups and CSRF checks read a module global instead of the system clock.
+Creation paths that stamp new expiries keep using ``time.time()``.
+"""
+
+import os
+import threading
+import time
+from typing import Final
+
+# ---------------- tunables ----------------
+TICK_SECONDS: Final = 1.0
+# Deadlines closer than this to the ticked time are re-checked against
+# time.time(), so a late tick can never report a live deadline as passed
+# or an expired one as live.
+MAX_TICK_LAG: Final = 2
+
+_current_time: int = 0
+_ticker: threading.Thread | None = None
+_ticker_lock = threading.Lock()
+
+
+def _tick() -> None:
+    global _current_time
+    while True:
+        _current_time = int(time.time())
+        time.sleep(TICK_SECONDS)
+
+
+def _start_ticker() -> None:
+    global _ticker, _current_time
+    with _ticker_lock:
+        if _ticker is None:
+            _current_time = int(time.time())
+            _ticker = threading.Thread(target=_tick, name="coarse-clock", daemon=True)
+            _ticker.start()
+
+
+def _reset_ticker() -> None:
+    # Threads do not survive fork; the child starts its own ticker on first use
+    global _ticker
+    _ticker = None
+
+
+os.register_at_fork(after_in_child=_reset_ticker)
+
+
+def current_time() -> int:
+    """Return the ticked wall-clock time in whole seconds.
+
+    The value trails ``time.time()`` by at most about one tick.
+    """
+    if _ticker is None:
+        _start_ticker()
+    return _current_time
+
+
+def has_passed(deadline: float) -> bool:
+    """Return True once the wall clock is strictly past ``deadline``.
+
+    Equivalent to ``time.time() > deadline``, but only reads the system
+    clock when ``deadline`` lies within ``MAX_TICK_LAG`` seconds of the
+    ticked time.
+    """
+    now = current_time()
+    if now > deadline:
+        return True
+    if deadline - now > MAX_TICK_LAG:
+        return False
+    return time.time() > deadline
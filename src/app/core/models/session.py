@@ -4,9 +4,13 @@ import time
 from typing import Any
 
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
+from src.app.core.clock import current_time, has_passed
 
-class AuthSession(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class AuthSession:
     """Temporary session for OIDC authorization flow with security enhancements."""
 
     id: str = Field(description="Session identifier")
@@ -48,14 +52,15 @@ class AuthSession(BaseModel):
 
     def is_expired(self) -> bool:
         """Check if session is expired."""
-        return time.time() > self.expires_at
+        return has_passed(self.expires_at)
 
     def mark_used(self) -> None:
         """Mark session as used (for single-use enforcement)."""
         self.used = True
 
 
-class UserSession(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserSession:
     """Persistent user session after successful authentication."""
 
     id: str = Field(description="Session identifier")
@@ -98,11 +103,19 @@ class UserSession(BaseModel):
 
     def is_expired(self) -> bool:
         """Check if session is expired."""
-        return time.time() > self.expires_at
-
-    def update_access(self) -> None:
-        """Update last accessed time."""
-        self.last_accessed_at = int(time.time())
+        return has_passed(self.expires_at)
+
+    def update_access(self) -> bool:
+        """Update last accessed time (to the ticked, whole-second clock).
+
+        Returns:
+            True if the timestamp advanced, False if it was already current
+        """
+        now = current_time()
+        if now <= self.last_accessed_at:
+            return False
+        self.last_accessed_at = now
+        return True
 
     def rotate_session_id(self, new_session_id: str) -> None:
         """Rotate session ID for security."""
@@ -4,12 +4,18 @@ import base64
 import hashlib
 import hmac
 import secrets
-import time
+from functools import lru_cache
+from typing import Final
 
 from fastapi import Request
 
+from src.app.core.clock import current_time
 from src.app.runtime.context import get_config
 
+# CSRF tokens are stamped with a power-of-two window index (4096 s, about an
+# hour) so the bucket is a shift of the wall clock rather than a division.
+CSRF_WINDOW_SHIFT: Final = 12
+
 
 def generate_secure_token(length: int = 32) -> str:
     """Generate a cryptographically secure random token.
@@ -20,11 +26,7 @@ def generate_secure_token(length: int = 32) -> str:
     Returns:
         URL-safe base64 encoded token
     """
-    return (
-        base64.urlsafe_b64encode(secrets.token_bytes(length))
-        .decode("utf-8")
-        .rstrip("=")
-    )
+    return secrets.token_urlsafe(length)
 
 
 def generate_nonce() -> str:
@@ -55,38 +57,50 @@ def generate_pkce_pair() -> tuple[str, str]:
     code_verifier = generate_secure_token(32)
 
     # Create SHA256 challenge
-    challenge_bytes = hashlib.sha256(code_verifier.encode("utf-8")).digest()
+    challenge_bytes = hashlib.sha256(code_verifier.encode("ascii")).digest()
     code_challenge = (
-        base64.urlsafe_b64encode(challenge_bytes).decode("utf-8").rstrip("=")
+        base64.urlsafe_b64encode(challenge_bytes).decode("ascii").rstrip("=")
     )
 
     return code_verifier, code_challenge
 
 
+@lru_cache(maxsize=8)
+def _csrf_hmac_template(secret: str) -> hmac.HMAC:
+    """Return an HMAC-SHA256 already keyed with ``secret``.
+
+    Callers must ``copy()`` it; the template itself is never updated.
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _csrf_signature(session_id: str, timestamp: int) -> str:
+    """Return the hex HMAC-SHA256 of ``session_id`` and ``timestamp``."""
+    config = get_config()
+    if not config.app.csrf_signing_secret:
+        raise ValueError("CSRF_SIGNING_SECRET must be set to generate CSRF tokens")
+
+    # Copying the keyed template skips re-absorbing the key pads per token
+    mac = _csrf_hmac_template(config.app.csrf_signing_secret).copy()
+    mac.update(f"{session_id}:{timestamp}".encode())
+    return mac.hexdigest()
+
+
 def generate_csrf_token(session_id: str, timestamp: int | None = None) -> str:
     """Generate CSRF token bound to session and time.
 
     Args:
         session_id: Session identifier to bind token to
-        timestamp: Optional timestamp (defaults to current hour)
+        timestamp: Optional window index (defaults to the current window)
 
     Returns:
         HMAC-based CSRF token
     """
     if timestamp is None:
-        timestamp = int(time.time() // 3600)  # Hour-based for reasonable lifetime
-
-    config = get_config()
-    if not config.app.csrf_signing_secret:
-        raise ValueError("CSRF_SIGNING_SECRET must be set to generate CSRF tokens")
-
-    secret_key = config.app.csrf_signing_secret.encode()
-
-    message = f"{session_id}:{timestamp}"
-    csrf_token = hmac.new(secret_key, message.encode(), hashlib.sha256).hexdigest()
+        timestamp = current_time() >> CSRF_WINDOW_SHIFT
 
     # Include timestamp for verification
-    return f"{timestamp}:{csrf_token}"
+    return f"{timestamp}:{_csrf_signature(session_id, timestamp)}"
 
 
 def validate_csrf_token(
@@ -114,17 +128,18 @@ def validate_csrf_token(
         token_timestamp, token_value = parts
         timestamp = int(token_timestamp)
 
-        # Check token age
-        current_hour = int(time.time() // 3600)
-        if current_hour - timestamp > max_age_hours:
+        # Check token age at window granularity. Allow one window of slack on
+        # both sides so a token issued just before a boundary, or by a worker
+        # whose clock runs slightly ahead, is not rejected early.
+        age_windows = (current_time() >> CSRF_WINDOW_SHIFT) - timestamp
+        max_age = max_age_hours * 3600 + (1 << CSRF_WINDOW_SHIFT)
+        if age_windows < -1 or age_windows << CSRF_WINDOW_SHIFT > max_age:
             return False
 
-        # Generate expected token
-        expected_token = generate_csrf_token(session_id, timestamp)
-        expected_value = expected_token.split(":", 1)[1]
+        expected_value = _csrf_signature(session_id, timestamp)
 
-        # Constant-time comparison
-        return hmac.compare_digest(expected_value, token_value)
+        # Constant-time comparison on bytes; str operands must be ASCII-only
+        return hmac.compare_digest(expected_value.encode(), token_value.encode())
 
     except (ValueError, IndexError):
         return False
@@ -1,55 +1,67 @@
-"""Core services exports."""
+"""Core services exports.
 
-# JWT Services
-# Session Storage for testing
-from src.app.core.storage.session_storage import (
-    InMemorySessionStorage,
-    RedisSessionStorage,
-)
+Exports are resolved lazily on first attribute access, so importing one
+service module (e.g. ``services.session.user_session``) does not pull in
+the OIDC, JWT, Temporal and database stacks through this package.
+"""
 
-# Database Service
-from .database.db_session import DbSessionService
-from .jwt.jwks import JWKSCache, JWKSCacheInMemory, JwksService
-from .jwt.jwt_gen import JwtGeneratorService
-from .jwt.jwt_verify import JwtVerificationService
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# OIDC Services
-from .oidc_client_service import OidcClientService
+if TYPE_CHECKING:
+    from src.app.core.storage.session_storage import (
+        InMemorySessionStorage,
+        RedisSessionStorage,
+    )
 
-# Redis Service
-from .redis_service import RedisService
+    from .database.db_session import DbSessionService
+    from .jwt.jwks import JWKSCache, JWKSCacheInMemory, JwksService
+    from .jwt.jwt_gen import JwtGeneratorService
+    from .jwt.jwt_verify import JwtVerificationService
+    from .oidc_client_service import OidcClientService
+    from .redis_service import RedisService
+    from .session.auth_session import AuthSessionService
+    from .session.user_session import UserSessionService
+    from .temporal.temporal_client import TemporalClientService
+    from .user.user_management import UserManagementService
 
-# Session Services
-from .session.auth_session import AuthSessionService
-from .session.user_session import UserSessionService
-
-# Temporal Services
-from .temporal.temporal_client import TemporalClientService
-
-# User Services
-from .user.user_management import UserManagementService
-
-__all__ = [
+# Export name -> module that defines it
+_EXPORTS = {
     # JWT Services
-    "JWKSCache",
-    "JWKSCacheInMemory",
-    "JwksService",
-    "JwtGeneratorService",
-    "JwtVerificationService",
+    "JWKSCache": ".jwt.jwks",
+    "JWKSCacheInMemory": ".jwt.jwks",
+    "JwksService": ".jwt.jwks",
+    "JwtGeneratorService": ".jwt.jwt_gen",
+    "JwtVerificationService": ".jwt.jwt_verify",
     # Session Services
-    "AuthSessionService",
-    "UserSessionService",
+    "AuthSessionService": ".session.auth_session",
+    "UserSessionService": ".session.user_session",
     # User Services
-    "UserManagementService",
+    "UserManagementService": ".user.user_management",
     # OIDC Services
-    "OidcClientService",
+    "OidcClientService": ".oidc_client_service",
     # Session Storage for testing
-    "InMemorySessionStorage",
-    "RedisSessionStorage",
+    "InMemorySessionStorage": "src.app.core.storage.session_storage",
+    "RedisSessionStorage": "src.app.core.storage.session_storage",
     # Database Service
-    "DbSessionService",
+    "DbSessionService": ".database.db_session",
     # Redis Service
-    "RedisService",
+    "RedisService": ".redis_service",
     # Temporal Services
-    "TemporalClientService",
-]
+    "TemporalClientService": ".temporal.temporal_client",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,16 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
+import httpx
 from cachetools import TTLCache
 from fastapi import HTTPException
 from loguru import logger
 
 from src.app.runtime.config.config_data import OIDCProviderConfig
+from src.app.runtime.context import get_config
 
 
 class JWKSCache(ABC):
@@ -39,10 +44,24 @@ class JWKSCache(ABC):
 
 
 class JWKSCacheInMemory(JWKSCache):
-    _JWKS_CACHE: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=10, ttl=3600)
+    def __init__(
+        self,
+        ttl: int | None = None,
+        maxsize: int = 32,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an in-process JWKS cache.
 
-    def __init__(self) -> None:
-        pass
+        Args:
+            ttl: Seconds before a cached JWKS expires. Defaults to ``jwt.jwks_cache_ttl``.
+            maxsize: Maximum number of issuers to cache
+            timer: Clock used for expiry (injectable for tests)
+        """
+        if ttl is None:
+            ttl = get_config().jwt.jwks_cache_ttl
+        self._JWKS_CACHE: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
 
     def get_jwks(self, issuer_url: str) -> dict[str, Any]:
         """Get JWKS for the given issuer URL, using cache if available.
@@ -72,6 +91,22 @@ class JWKSCacheInMemory(JWKSCache):
 class JwksService:
     def __init__(self, cache: JWKSCache) -> None:
         self._cache = cache
+        self._client: httpx.AsyncClient | None = None
+        self._fetch_locks: dict[str, asyncio.Lock] = {}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=5.0, limits=httpx.Limits(max_keepalive_connections=4)
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch_jwks(self, issuer: OIDCProviderConfig) -> dict[str, Any]:
         jwks_url = issuer.jwks_uri
@@ -85,16 +120,21 @@ class JwksService:
         if jwks:
             return jwks
 
-        import httpx  # local import to avoid forcing httpx at import time
+        # Single-flight: concurrent misses for the same issuer wait on one fetch
+        lock = self._fetch_locks.setdefault(jwks_url, asyncio.Lock())
+        async with lock:
+            jwks = self._cache.get_jwks(jwks_url)
+            if jwks:
+                return jwks
 
-        try:
-            async with httpx.AsyncClient(timeout=5) as client:
+            try:
+                client = await self._get_client()
                 resp = await client.get(jwks_url)
                 resp.raise_for_status()
                 jwks = resp.json()
                 self._cache.set_jwks(jwks_url, jwks)
                 return jwks
-        except Exception as exc:
-            raise HTTPException(
-                status_code=500, detail=f"Failed to fetch JWKS: {exc}"
-            ) from exc
+            except Exception as exc:
+                raise HTTPException(
+                    status_code=500, detail=f"Failed to fetch JWKS: {exc}"
+                ) from exc
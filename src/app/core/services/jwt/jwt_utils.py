@@ -4,7 +4,6 @@ import time
 from dataclasses import dataclass
 from typing import Any, Final
 
-from cachetools.func import lru_cache
 from fastapi import HTTPException
 from loguru import logger
 
@@ -106,59 +105,82 @@ def preview_jwt(token: str) -> JwtPreview:
     )
 
 
-@lru_cache(maxsize=24)
-def lookup_config_by_issuer(issuer: str) -> OIDCProviderConfig | None:
-    """Look up OIDC provider config by issuer URL."""
-    config = get_config()
+# (per-provider (name, identity, issuer) key, issuer -> provider index) for the
+# active config. The index holds the providers, so their ids stay unique.
+_issuer_index: (
+    tuple[tuple[tuple[str, int, object], ...], dict[str, OIDCProviderConfig]] | None
+) = None
+
+
+def _get_issuer_index(
+    providers: dict[str, OIDCProviderConfig],
+) -> dict[str, OIDCProviderConfig]:
+    """Return the issuer index for ``providers``, rebuilding it when they change.
+
+    The index is rebuilt whenever a provider is added, removed or replaced,
+    or a provider's issuer changes, including through a config override.
+    """
+    global _issuer_index
+    key = tuple(
+        (name, id(p), getattr(p, "issuer", None)) for name, p in providers.items()
+    )
+    cached = _issuer_index
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-    for p in config.oidc.providers.values():
+    index: dict[str, OIDCProviderConfig] = {}
+    for p in providers.values():
         iss = getattr(p, "issuer", None)
-        if isinstance(iss, str) and iss.rstrip("/") == issuer.rstrip("/"):
-            return p
-    return None
+        if isinstance(iss, str):
+            index.setdefault(iss.rstrip("/"), p)
+    _issuer_index = (key, index)
+    return index
+
+
+def lookup_config_by_issuer(issuer: str) -> OIDCProviderConfig | None:
+    """Look up OIDC provider config by issuer URL."""
+    providers = get_config().oidc.providers
+    return _get_issuer_index(providers).get(issuer.rstrip("/"))
 
 
 def extract_uid(claims: dict[str, Any]) -> str:
     main_config = get_config()
     uid_claim = main_config.jwt.claims.user_id
     if uid_claim and uid_claim in claims:
-        return claims[uid_claim]
+        return str(claims[uid_claim])
     return f"{claims.get('iss')}|{claims.get('sub')}"
 
 
+_ROLE_CLAIMS: Final = ("role", "roles", "groups", "authorities")
+
+
 def extract_scopes(claims: dict[str, Any]) -> list[str]:
     """Extract scopes from JWT claims, preserving order.
 
     Scopes can be in various claims: 'scope' (space-separated), 'scp' (string or array),
     or 'scopes' (array). Returns as a list with deduplication, preserving first occurrence order.
     """
-    seen = set()
-    scopes = []
-
-    # Helper to add scopes while preserving order and deduplication
-    def add_scope_items(items):
-        for item in items:
-            if item not in seen:
-                seen.add(item)
-                scopes.append(item)
+    items: list[str] = []
 
     # 'scope' claim (space-separated string)
     if "scope" in claims:
-        add_scope_items(str(claims["scope"]).split())
+        value = claims["scope"]
+        items += (value if type(value) is str else str(value)).split()
 
     # 'scp' claim (string or array)
-    if "scp" in claims:
-        value = claims["scp"]
-        if isinstance(value, str):
-            add_scope_items(value.split())
-        elif isinstance(value, (list, tuple)):
-            add_scope_items(value)
+    value = claims.get("scp")
+    if type(value) is str:
+        items += value.split()
+    elif type(value) is list or type(value) is tuple:
+        items += value
 
     # 'scopes' claim (array)
-    if "scopes" in claims and isinstance(claims["scopes"], (list, tuple)):
-        add_scope_items(claims["scopes"])
+    value = claims.get("scopes")
+    if type(value) is list or type(value) is tuple:
+        items += value
 
-    return scopes
+    # dict.fromkeys dedupes in one pass while keeping first-occurrence order
+    return list(dict.fromkeys(items))
 
 
 def extract_roles(claims: dict[str, Any]) -> list[str]:
@@ -169,35 +191,35 @@ def extract_roles(claims: dict[str, Any]) -> list[str]:
     roles: list[str] = []
 
     # Check for common role claims (both singular and plural)
-    for role_claim in ["role", "roles", "groups", "authorities"]:
+    for role_claim in _ROLE_CLAIMS:
         value = claims.get(role_claim)
         if value:
-            if isinstance(value, list):
-                print("Extracted roles from list:", value)
-                roles.extend(value)
-            elif isinstance(value, str):
+            if type(value) is list:
+                roles += value
+            elif type(value) is str:
                 # Handle space-separated roles string
-                roles.extend(value.split())
+                roles += value.split()
             else:
                 roles.append(str(value))
 
     # Check for Auth0 style roles (e.g., in app_metadata or custom claims)
-    app_metadata = claims.get("app_metadata", {})
-    if isinstance(app_metadata, dict) and "roles" in app_metadata:
-        auth0_roles = app_metadata["roles"]
-        if isinstance(auth0_roles, list):
-            roles.extend(auth0_roles)
+    app_metadata = claims.get("app_metadata")
+    if type(app_metadata) is dict:
+        auth0_roles = app_metadata.get("roles")
+        if type(auth0_roles) is list:
+            roles += auth0_roles
 
     # Check for Keycloak realm roles
-    if "realm_access" in claims and "roles" in claims["realm_access"]:
-        keycloak_roles = claims["realm_access"]["roles"]
-        if isinstance(keycloak_roles, list):
-            roles.extend(keycloak_roles)
+    realm_access = claims.get("realm_access")
+    if realm_access and "roles" in realm_access:
+        keycloak_roles = realm_access["roles"]
+        if type(keycloak_roles) is list:
+            roles += keycloak_roles
 
     # Check for custom namespace roles (Auth0 custom claims pattern)
     for key, value in claims.items():
-        if key != "roles" and "roles" in key.lower() and isinstance(value, list):
-            roles.extend(value)
+        if type(value) is list and key != "roles" and "roles" in key.lower():
+            roles += value
     return roles
 
 
@@ -267,7 +289,7 @@ def create_token_claims(
     # Note: We need to be careful here since extract_scopes/extract_roles handle multiple variations
     for scope_claim in ["scope", "scopes", "scp"]:
         remaining_claims.pop(scope_claim, None)
-    for role_claim in ["role", "roles", "groups", "authorities"]:
+    for role_claim in _ROLE_CLAIMS:
         remaining_claims.pop(role_claim, None)
 
     # Remove nested structures that we've processed for roles
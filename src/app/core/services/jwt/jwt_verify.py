@@ -1,8 +1,10 @@
 """JWT verification service."""
 
+import hashlib
 import time
 
 from authlib.jose import JoseError, JsonWebKey, jwt
+from cachetools import TLRUCache
 from fastapi import HTTPException
 from loguru import logger
 
@@ -14,16 +16,58 @@ from src.app.core.services.jwt.jwt_utils import (
     lookup_config_by_issuer,
     preview_jwt,
 )
+from src.app.runtime.config.config_data import ConfigData
 from src.app.runtime.context import get_config
 
+# ---------------- tunables ----------------
+VERIFIED_CACHE_MAXSIZE = 10_000
+VERIFIED_CACHE_TTL = 5  # seconds; never beyond the token's own exp
+
 
 # ---------------------------- helpers ---------------------------------
 def _as_list(v):
     return [v] if isinstance(v, str) else list(v or ())
 
+
+def _verified_cache_ttu(_key: bytes, claims: TokenClaims, now: float) -> float:
+    return min(now + VERIFIED_CACHE_TTL, claims.expires_at)
+
+
+def _verified_cache_key(
+    token: str, cfg: ConfigData, key: object, *options: object
+) -> bytes:
+    """Hash the token together with everything that can change its verdict.
+
+    That is the verification key, the per-call options, and the effective
+    JWT, OIDC and session signing settings, so a cached result is only
+    reused under the configuration that produced it. Key objects are keyed
+    by their JWK thumbprint, never by repr.
+
+    This is an in-process cache key, not a token fingerprint, so the faster
+    BLAKE2b with a 128-bit digest is used rather than SHA-256.
+    """
+    if key is not None and not isinstance(key, str):
+        key = key.thumbprint()  # type: ignore[attr-defined]
+    h = hashlib.blake2b(token.encode(), digest_size=16)
+    h.update(repr((key, *options)).encode())
+    h.update(cfg.jwt.model_dump_json().encode())
+    h.update(cfg.oidc.model_dump_json().encode())
+    h.update(repr(cfg.app.session_signing_secret).encode())
+    return h.digest()
+
+
 class JwtVerificationService:
     def __init__(self, jwks_service: JwksService):
         self._jwks_service = jwks_service
+        # Short-lived cache of successful verifications so replayed bearer
+        # tokens skip signature checks. Keyed by hash, never the raw token.
+        self._verified_cache: TLRUCache[bytes, TokenClaims] = TLRUCache(
+            maxsize=VERIFIED_CACHE_MAXSIZE, ttu=_verified_cache_ttu, timer=time.time
+        )
+
+    def clear_verified_cache(self) -> None:
+        """Clear the cache of verified tokens."""
+        self._verified_cache.clear()
 
     async def verify_jwt(
         self,
@@ -36,6 +80,13 @@ class JwtVerificationService:
         preview: JwtPreview | None = None,
     ) -> TokenClaims:
         cfg = get_config()
+        cache_key = _verified_cache_key(
+            token, cfg, key, expected_audience, expected_nonce, expected_issuer
+        )
+        cached = self._verified_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy()
+
         pv = preview or preview_jwt(token)
 
         # alg allowlist
@@ -165,9 +216,11 @@ class JwtVerificationService:
             if ("nonce" in claims or expected_nonce is not None)
             else "access_token"
         )
-        return create_token_claims(
+        token_claims = create_token_claims(
             token=token, claims=claims, token_type=token_type, issuer=claims.get("iss")
         )
+        self._verified_cache[cache_key] = token_claims
+        return token_claims.model_copy()
 
 
 
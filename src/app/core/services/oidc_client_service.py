@@ -1,5 +1,7 @@
 """OIDC client service for handling authorization code flow with PKCE."""
 
+import time
+
 import httpx
 from loguru import logger
 from pydantic import BaseModel
@@ -24,8 +26,6 @@ class TokenResponse(BaseModel):
     @property
     def expires_at(self) -> int:
         """Calculate absolute expiry timestamp."""
-        import time
-
         return int(time.time()) + self.expires_in
 
 
@@ -34,6 +34,28 @@ class OidcClientService:
 
     def __init__(self, jwt_verify_service: JwtVerificationService) -> None:
         self._jwt_verify = jwt_verify_service
+        self._client: httpx.AsyncClient | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one pooled client keeps connections to the provider alive
+        instead of paying a TCP/TLS handshake on every token or userinfo call.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=100
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def exchange_code_for_tokens(
         self, code: str, pkce_verifier: str, provider: str
@@ -68,14 +90,13 @@ class OidcClientService:
             encoded_credentials = base64.b64encode(credentials.encode()).decode()
             headers["Authorization"] = f"Basic {encoded_credentials}"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                provider_config.token_endpoint, data=token_data, headers=headers
-            )
-            response.raise_for_status()
+        client = await self._get_client()
+        response = await client.post(
+            provider_config.token_endpoint, data=token_data, headers=headers
+        )
+        response.raise_for_status()
 
-            token_data = response.json()
-            return TokenResponse(**token_data)
+        return TokenResponse.model_validate_json(response.content)
 
     async def get_user_claims(
         self, access_token: str, id_token: str | None, provider: str
@@ -116,18 +137,18 @@ class OidcClientService:
         if provider_config.userinfo_endpoint:
             headers = {"Authorization": f"Bearer {access_token}"}
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    provider_config.userinfo_endpoint, headers=headers
-                )
-                response.raise_for_status()
-                claims = response.json()
-                return create_token_claims(
-                    token=access_token,
-                    claims=claims,
-                    token_type="access_token",
-                    issuer=provider_config.issuer,
-                )
+            client = await self._get_client()
+            response = await client.get(
+                provider_config.userinfo_endpoint, headers=headers
+            )
+            response.raise_for_status()
+            claims = response.json()
+            return create_token_claims(
+                token=access_token,
+                claims=claims,
+                token_type="access_token",
+                issuer=provider_config.issuer,
+            )
 
         # Best practice is to raise an exception, as this is an unexpected error state.
         raise ValueError(
@@ -162,11 +183,10 @@ class OidcClientService:
             encoded_credentials = base64.b64encode(credentials.encode()).decode()
             headers["Authorization"] = f"Basic {encoded_credentials}"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                provider_config.token_endpoint, data=token_data, headers=headers
-            )
-            response.raise_for_status()
+        client = await self._get_client()
+        response = await client.post(
+            provider_config.token_endpoint, data=token_data, headers=headers
+        )
+        response.raise_for_status()
 
-            token_data = response.json()
-            return TokenResponse(**token_data)
+        return TokenResponse.model_validate_json(response.content)
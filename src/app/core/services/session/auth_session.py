@@ -1,3 +1,4 @@
+import math
 import secrets
 import time
 
@@ -8,6 +9,11 @@ from src.app.core.security import (
 from src.app.core.storage.session_storage import SessionStorage
 from src.app.runtime.context import get_config
 
+# ---------------- tunables ----------------
+AUTH_SESSION_ID_BYTES = 32
+# Length of an unpadded urlsafe-base64 id; any other length cannot be ours
+AUTH_SESSION_ID_LENGTH = math.ceil(AUTH_SESSION_ID_BYTES * 4 / 3)
+
 
 class AuthSessionService:
     def __init__(self, session_storage: SessionStorage) -> None:
@@ -42,7 +48,7 @@ class AuthSessionService:
         )
 
         auth_session = AuthSession.create(
-            session_id=secrets.token_urlsafe(32),
+            session_id=secrets.token_urlsafe(AUTH_SESSION_ID_BYTES),
             pkce_verifier=pkce_verifier,
             state=state,
             nonce=nonce,
@@ -64,6 +70,10 @@ class AuthSessionService:
         Returns:
             Auth session or None if not found/expired/invalid
         """
+        # Reject malformed ids (e.g. probes) without a storage round-trip
+        if len(session_id) != AUTH_SESSION_ID_LENGTH:
+            return None
+
         auth_session: AuthSession | None = await self._storage.get(
             f"auth:{session_id}", AuthSession
         )
@@ -86,11 +86,14 @@ class UserSessionService:
             await storage.delete(f"user:{session_id}")
             return None
 
-        # Update last accessed time
-        user_session.update_access()
-        await storage.set(
-            f"user:{user_session.id}", user_session, get_config().app.session_max_age
-        )
+        # Update last accessed time; repeat reads within the same second
+        # skip the storage write
+        if user_session.update_access():
+            await storage.set(
+                f"user:{user_session.id}",
+                user_session,
+                get_config().app.session_max_age,
+            )
 
         return user_session
 
@@ -43,14 +43,20 @@ class UserManagementService:
             identity_repo = self._identity_repo
             user_repo = self._user_repo
 
-            # Try to find existing identity
-            identity = None
-            if uid:
-                identity = identity_repo.get_by_uid(uid)
-            if identity is None:
-                identity = identity_repo.get_by_issuer_subject(issuer, subject)
-
-            if identity is None:
+            # Find the user behind an existing identity (one joined query)
+            user = user_repo.get_by_identity(issuer, subject, uid)
+
+            if user is None:
+                # An identity without its user means inconsistent data; don't
+                # paper over it by provisioning a second user
+                identity = None
+                if uid:
+                    identity = identity_repo.get_by_uid(uid)
+                if identity is None:
+                    identity = identity_repo.get_by_issuer_subject(issuer, subject)
+                if identity is not None:
+                    raise ValueError("User identity exists but user not found")
+
                 # Create new user
                 email = claims.email
                 first_name = claims.given_name
@@ -88,11 +94,6 @@ class UserManagementService:
                 self._db_session.commit()
                 return created_user
             else:
-                # Return existing user - but should we update their info?
-                user = user_repo.get(identity.user_id)
-                if user is None:
-                    raise ValueError("User identity exists but user not found")
-
                 # Update user with fresh claims data
                 email = claims.email
                 first_name = claims.given_name
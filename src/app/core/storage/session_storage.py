@@ -6,26 +6,52 @@ with Redis-first approach and in-memory fallback.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import heapq
 import time
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
-T = TypeVar("T", bound=BaseModel)
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+T = TypeVar("T")
+
+# ---------------- tunables ----------------
+DEFAULT_MAX_IN_MEMORY_SESSIONS = 100_000
+# Floor on the in-memory sweeper's sleep, so a burst of near-simultaneous
+# expiries is swept in batches rather than one wakeup each
+MIN_SWEEP_INTERVAL_SECONDS = 1.0
+# The expiry heap is rebuilt from the live entries once it holds more than
+# this many entries per live session, so stale entries can't pile up
+EXPIRY_HEAP_COMPACT_RATIO = 2
+
+
+_adapters: dict[type[Any], TypeAdapter[Any]] = {}
+
+
+def _adapter[M](model_class: type[M]) -> TypeAdapter[M]:
+    """Return the (cached) serializer for a Pydantic model or dataclass."""
+    adapter = _adapters.get(model_class)
+    if adapter is None:
+        adapter = _adapters[model_class] = TypeAdapter(model_class)
+    return adapter
 
 
 class SessionStorage(ABC):
     """Abstract interface for session storage backends."""
 
     @abstractmethod
-    async def set(self, key: str, value: BaseModel, ttl_seconds: int) -> None:
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Store a session with TTL.
 
         Args:
             key: Session identifier
-            value: Session data (Pydantic model)
+            value: Session data (Pydantic model or dataclass)
             ttl_seconds: Time to live in seconds
         """
         pass
@@ -36,7 +62,7 @@ class SessionStorage(ABC):
 
         Args:
             key: Session identifier
-            model_class: Pydantic model class to deserialize to
+            model_class: Pydantic model or dataclass to deserialize to
 
         Returns:
             Session data or None if not found/expired
@@ -91,7 +117,7 @@ class SessionStorage(ABC):
 
         Args:
             pattern: Key pattern (e.g., "auth:*", "user:*")
-            model_class: Pydantic model class to deserialize to
+            model_class: Pydantic model or dataclass to deserialize to
 
         Returns:
             List of valid, non-expired sessions
@@ -107,83 +133,164 @@ class SessionStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def start(self) -> None:
+        """Start background maintenance, if the backend needs any."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop background maintenance started by ``start()``."""
+        pass
+
 
 class InMemorySessionStorage(SessionStorage):
-    """In-memory session storage with TTL support."""
+    """In-memory session storage with TTL support.
+
+    Serialized payloads and expiry times are kept in parallel maps, so
+    expiry checks and sweeps only touch the small ``key -> expires_at``
+    table and never load the session payloads.
+
+    Entries are indexed by a min-heap of ``(expires_at, key)`` so expired
+    sessions are evicted in expiry order without scanning the whole store.
+    Heap entries left behind by overwrites, deletes or evictions are skipped
+    on pop, and the heap is rebuilt once they outnumber the live entries.
+
+    The store is also capped at ``max_sessions`` entries; once full, the
+    least recently used session is evicted to make room.
+
+    Once ``start()`` is called, a background task sleeps until the earliest
+    expiry in the heap and sweeps then, so an idle store costs no wakeups.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_IN_MEMORY_SESSIONS):
+        # Serialized payloads, in least- to most-recently-used order
+        self._data: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._expires_at: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._max_sessions = max_sessions
+        self._sweeper_task: asyncio.Task[None] | None = None
+        self._sweep_wakeup = asyncio.Event()
+
+    def _drop(self, key: str) -> None:
+        self._data.pop(key, None)
+        self._expires_at.pop(key, None)
 
-    def __init__(self):
-        self._data: dict[str, dict[str, Any]] = {}
+    def _is_live(self, key: str) -> bool:
+        """Return whether ``key`` is stored and unexpired, dropping it if expired."""
+        expires_at = self._expires_at.get(key)
+        if expires_at is None:
+            return False
+        if time.time() > expires_at:
+            self._drop(key)
+            return False
+        return True
 
-    async def set(self, key: str, value: BaseModel, ttl_seconds: int) -> None:
+    def _sweep_expired(self, now: float) -> int:
+        """Pop expired heap entries and drop the sessions they still own."""
+        removed = 0
+        heap = self._expiry_heap
+        expiries = self._expires_at
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            if expiries.get(key) == expires_at:
+                self._drop(key)
+                removed += 1
+        return removed
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the heap from the live expiries once stale entries dominate."""
+        if len(self._expiry_heap) > EXPIRY_HEAP_COMPACT_RATIO * len(self._expires_at):
+            self._expiry_heap = [
+                (expires_at, key) for key, expires_at in self._expires_at.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    async def _sweeper(self) -> None:
+        """Sleep until the earliest expiry, sweep, and repeat."""
+        while True:
+            self._sweep_wakeup.clear()
+            timeout = None
+            if self._expiry_heap:
+                timeout = max(
+                    MIN_SWEEP_INTERVAL_SECONDS,
+                    self._expiry_heap[0][0] - time.time(),
+                )
+            try:
+                await asyncio.wait_for(self._sweep_wakeup.wait(), timeout)
+            except TimeoutError:
+                self._sweep_expired(time.time())
+
+    def start(self) -> None:
+        """Start the expiry sweeper on the running event loop."""
+        if self._sweeper_task is None:
+            self._sweeper_task = asyncio.create_task(
+                self._sweeper(), name="session-sweeper"
+            )
+
+    async def close(self) -> None:
+        """Stop the expiry sweeper."""
+        task, self._sweeper_task = self._sweeper_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Store session in memory with expiration."""
-        expires_at = time.time() + ttl_seconds
-        self._data[key] = {
-            "data": json.loads(value.model_dump_json()),
-            "expires_at": expires_at,
-        }
+        now = time.time()
+        self._sweep_expired(now)
+        expires_at = now + ttl_seconds
+        self._data[key] = _adapter(type(value)).dump_python(value, mode="json")
+        self._data.move_to_end(key)
+        self._expires_at[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        if self._expiry_heap[0][1] == key:
+            # New earliest expiry: reschedule the sweeper
+            self._sweep_wakeup.set()
+
+        while len(self._data) > self._max_sessions:
+            evicted, _ = self._data.popitem(last=False)
+            del self._expires_at[evicted]
+        self._compact_expiry_heap()
 
     async def get(self, key: str, model_class: type[T]) -> T | None:
         """Retrieve session from memory if not expired."""
-        if key not in self._data:
-            return None
-
-        entry = self._data[key]
-        if time.time() > entry["expires_at"]:
-            del self._data[key]
+        if not self._is_live(key):
             return None
 
         try:
-            return model_class.model_validate(entry["data"])
+            session = _adapter(model_class).validate_python(self._data[key])
         except Exception:
             # Clean up corrupted data
-            del self._data[key]
+            self._drop(key)
             return None
 
+        self._data.move_to_end(key)
+        return session
+
     async def delete(self, key: str) -> None:
         """Delete session from memory."""
-        self._data.pop(key, None)
+        self._drop(key)
+        self._compact_expiry_heap()
 
     async def exists(self, key: str) -> bool:
         """Check if session exists and is not expired."""
-        if key not in self._data:
-            return False
-
-        entry = self._data[key]
-        if time.time() > entry["expires_at"]:
-            del self._data[key]
-            return False
-
-        return True
+        return self._is_live(key)
 
     async def cleanup_expired(self) -> int:
         """Remove expired sessions from memory."""
-        now = time.time()
-        expired_keys = [
-            key for key, entry in self._data.items() if now > entry["expires_at"]
-        ]
-
-        for key in expired_keys:
-            del self._data[key]
-
-        return len(expired_keys)
+        return self._sweep_expired(time.time())
 
     async def list_keys(self, pattern: str) -> list[str]:
         """List keys matching a pattern using fnmatch."""
         import fnmatch
 
-        matching_keys = []
-
-        for key in self._data.keys():
-            if fnmatch.fnmatch(key, pattern):
-                # Check if session is still valid (not expired)
-                entry = self._data[key]
-                if time.time() <= entry["expires_at"]:
-                    matching_keys.append(key)
-                else:
-                    # Clean up expired session
-                    del self._data[key]
+        # Evict everything already expired via the heap, so the remaining
+        # entries only need the pattern test
+        self._sweep_expired(time.time())
 
-        return matching_keys
+        return fnmatch.filter(self._data.keys(), pattern)
 
     async def list_sessions(self, pattern: str, model_class: type[T]) -> list[T]:
         """List sessions matching a pattern."""
@@ -209,14 +316,14 @@ class InMemorySessionStorage(SessionStorage):
 class RedisSessionStorage(SessionStorage):
     """Redis-based session storage with serialization."""
 
-    def __init__(self, redis_client):
+    def __init__(self, redis_client: Redis) -> None:
         self._redis = redis_client
         self._available = True
 
-    async def set(self, key: str, value: BaseModel, ttl_seconds: int) -> None:
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Store session in Redis with TTL."""
         try:
-            data = value.model_dump_json()
+            data = _adapter(type(value)).dump_json(value)
             await self._redis.setex(key, ttl_seconds, data)
             self._available = True
         except Exception as e:
@@ -234,7 +341,7 @@ class RedisSessionStorage(SessionStorage):
             if isinstance(data, bytes):
                 data = data.decode("utf-8")
 
-            return model_class.model_validate_json(data)
+            return _adapter(model_class).validate_json(data)
         except Exception as e:
             self._available = False
             raise RuntimeError(f"Redis get failed: {e}") from e
@@ -305,6 +412,14 @@ class RedisSessionStorage(SessionStorage):
         """Check if Redis connection is healthy."""
         return self._available
 
+    def start(self) -> None:
+        """Redis expires keys itself; there is nothing to start."""
+        pass
+
+    async def close(self) -> None:
+        """Nothing to stop; see ``start()``."""
+        pass
+
     async def ping(self) -> bool:
         """Test Redis connection health."""
         try:
@@ -1,5 +1,6 @@
 import uuid
 from datetime import UTC, datetime
+from typing import Any, Self, cast
 
 import sqlalchemy as sa
 from pydantic import BaseModel
@@ -18,6 +19,16 @@ class Entity(BaseModel):
     created_at: datetime = PydanticField(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = PydanticField(default_factory=lambda: datetime.now(UTC))
 
+    @classmethod
+    def from_row(cls, row: Any) -> Self:
+        """Build the entity from a table row.
+
+        Calls the compiled validator directly, skipping the argument
+        handling that ``model_validate`` wraps around it.
+        """
+        entity = cls.__pydantic_validator__.validate_python(row, from_attributes=True)
+        return cast(Self, entity)
+
 
 class EntityTable(SQLModel, table=False):
     """Base entity class with auto-generated UUID identifier."""
@@ -34,13 +34,16 @@ class User(Entity):
             and self.address == other.address
         )
 
+    def __str__(self) -> str:
+        """Short display form for logs; ``repr()`` keeps the full field dump."""
+        name = f"{self.first_name} {self.last_name}"
+        return f"User({name} <{self.email}>)" if self.email else f"User({name})"
+
     def __hash__(self) -> int:
-        """Hash based on business attributes, ignoring timestamps."""
-        return hash((
-            self.id,
-            self.first_name,
-            self.last_name,
-            self.email,
-            self.phone,
-            self.address,
-        ))
+        """Hash by identifier only.
+
+        Users that compare equal always share an ``id``, so this stays
+        consistent with ``__eq__`` while reusing the string's cached hash
+        and keeping the hash stable when profile fields are edited.
+        """
+        return hash(self.id)
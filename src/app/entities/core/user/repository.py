@@ -1,11 +1,25 @@
 """User repository for data access."""
 
-from sqlmodel import Session, select
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import case
+from sqlmodel import Session, col, select
+
+from src.app.entities.core.user_identity.table import UserIdentityTable
 
 from .entity import User
 from .table import UserTable
 
 
+def _to_row(user: User) -> UserTable:
+    """Build the table row for a ``User``.
+
+    SQLModel table models validate in ``__init__`` as well, so passing the
+    fields as keyword arguments is no cheaper than ``model_validate``.
+    """
+    return UserTable.model_validate(user, from_attributes=True)
+
+
 class UserRepository:
     """Data access layer for User entities.
 
@@ -21,20 +35,67 @@ class UserRepository:
         row = self._session.get(UserTable, user_id)
         if row is None:
             return None
-        return User.model_validate(row, from_attributes=True)
+        return User.from_row(row)
+
+    def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Get several users by ID in one query, keyed by ID.
+
+        IDs with no matching user are simply absent from the result.
+        """
+        ids = list(user_ids)
+        if not ids:
+            return {}
+        statement = select(UserTable).where(col(UserTable.id).in_(ids))
+        rows = self._session.exec(statement).all()
+        return {row.id: User.from_row(row) for row in rows}
+
+    def get_by_identity(
+        self, issuer: str, subject: str, uid: str | None = None
+    ) -> User | None:
+        """Get the user linked to an external identity in a single query.
+
+        Matches on ``uid`` when given, falling back to ``issuer``/``subject``;
+        a ``uid`` match wins when both find a row.
+        """
+        issuer_subject = (col(UserIdentityTable.issuer) == issuer) & (
+            col(UserIdentityTable.subject) == subject
+        )
+        statement = select(UserTable).join(
+            UserIdentityTable, col(UserIdentityTable.user_id) == col(UserTable.id)
+        )
+        if uid:
+            uid_match = col(UserIdentityTable.uid_claim) == uid
+            statement = statement.where(uid_match | issuer_subject).order_by(
+                case((uid_match, 0), else_=1)
+            )
+        else:
+            statement = statement.where(issuer_subject)
+
+        row = self._session.exec(statement.limit(1)).first()
+        if row is None:
+            return None
+        return User.from_row(row)
 
     def list(self, offset: int = 0, limit: int = 100) -> list[User]:
         """List users with pagination."""
         statement = select(UserTable).offset(offset).limit(limit)
         rows = self._session.exec(statement).all()
-        return [User.model_validate(row, from_attributes=True) for row in rows]
+        return [User.from_row(row) for row in rows]
 
     def create(self, user: User) -> User:
         """Create a new user and return it. ID is auto-generated by the entity."""
-        row = UserTable.model_validate(user, from_attributes=True)
-        self._session.add(row)
+        self._session.add(_to_row(user))
         return user  # No need for flush/refresh - entity already has its ID!
 
+    def create_many(self, users: Sequence[User]) -> Sequence[User]:
+        """Create several users at once and return them.
+
+        Rows are registered with a single ``add_all`` and written together
+        on the caller's next flush or commit.
+        """
+        self._session.add_all([_to_row(user) for user in users])
+        return users
+
     def update(self, user: User) -> User:
         """Update an existing user."""
         row = self._session.get(UserTable, user.id)
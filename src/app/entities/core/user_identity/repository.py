@@ -22,7 +22,7 @@ class UserIdentityRepository:
         row = self._session.exec(statement).first()
         if row is None:
             return None
-        return UserIdentity.model_validate(row, from_attributes=True)
+        return UserIdentity.from_row(row)
 
     def get_by_issuer_subject(self, issuer: str, subject: str) -> UserIdentity | None:
         """Get a user identity by issuer and subject."""
@@ -33,13 +33,13 @@ class UserIdentityRepository:
         row = self._session.exec(statement).first()
         if row is None:
             return None
-        return UserIdentity.model_validate(row, from_attributes=True)
+        return UserIdentity.from_row(row)
 
     def list(self, offset: int = 0, limit: int = 100) -> list[UserIdentity]:
         """List user identities with pagination."""
         statement = select(UserIdentityTable).offset(offset).limit(limit)
         rows = self._session.exec(statement).all()
-        return [UserIdentity.model_validate(row, from_attributes=True) for row in rows]
+        return [UserIdentity.from_row(row) for row in rows]
 
     def create(self, identity: UserIdentity) -> UserIdentity:
         """Create a new user identity and return it. ID is auto-generated by the entity."""
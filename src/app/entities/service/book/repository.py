@@ -21,7 +21,7 @@ class BookRepository:
         row = self._session.get(BookTable, book_id)
         if row is None:
             return None
-        return Book.model_validate(row, from_attributes=True)
+        return Book.from_row(row)
 
     def create(self, book: Book) -> Book:
         """Create a new book and return it. ID is auto-generated by the entity."""
@@ -52,4 +52,4 @@ class BookRepository:
     def list_all(self) -> list[Book]:
         """List all books."""
         rows = self._session.query(BookTable).all()
-        return [Book.model_validate(row, from_attributes=True) for row in rows]
\ No newline at end of file
+        return [Book.from_row(row) for row in rows]
\ No newline at end of file
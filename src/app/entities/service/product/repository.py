@@ -21,7 +21,7 @@ class ProductRepository:
         row = self._session.get(ProductTable, product_id)
         if row is None:
             return None
-        return Product.model_validate(row, from_attributes=True)
+        return Product.from_row(row)
 
     def create(self, product: Product) -> Product:
         """Create a new product and return it. ID is auto-generated by the entity."""
@@ -52,4 +52,4 @@ class ProductRepository:
     def list_all(self) -> list[Product]:
         """List all products."""
         rows = self._session.query(ProductTable).all()
-        return [Product.model_validate(row, from_attributes=True) for row in rows]
\ No newline at end of file
+        return [Product.from_row(row) for row in rows]
\ No newline at end of file
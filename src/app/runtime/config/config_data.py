@@ -11,6 +11,10 @@ from typing import Any, Literal
 from loguru import logger
 from pydantic import BaseModel, Field, computed_field
 
+# Environments that get development conveniences (dev-only OIDC providers,
+# password parsed from the database URL, no origin/CSRF enforcement)
+DEV_ENVIRONMENTS: frozenset[str] = frozenset({"development", "test"})
+
 
 def deep_freeze(value: Any) -> Any:
     """Recursively convert mutable containers into hashable equivalents."""
@@ -304,6 +308,9 @@ class JWTConfig(BaseModel):
         description="JWT audiences that this API accepts",
     )
     clock_skew: int = Field(default=60, description="Clock skew tolerance in seconds")
+    jwks_cache_ttl: int = Field(
+        default=86400, description="Seconds to cache a provider's JWKS before refetching"
+    )
     verify_signature: bool = Field(default=True, description="Verify JWT signature")
     verify_exp: bool = Field(default=True, description="Verify token expiration")
     verify_nbf: bool = Field(default=True, description="Verify not-before claim")
@@ -367,7 +374,7 @@ class DatabaseConfig(BaseModel):
             by `password_file_path` or environment variable specified by `password_env_var`
         """
         password = None
-        if self.environment_mode == "development" or self.environment_mode == "test":
+        if self.environment_mode in DEV_ENVIRONMENTS:
             # In development mode, try to parse password from URL if present
             from sqlalchemy.engine import make_url
 
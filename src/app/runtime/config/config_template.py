@@ -2,16 +2,25 @@
 
 import os
 import re
+from collections.abc import Mapping
 from pathlib import Path
 
-import yaml
 from loguru import logger
 from pydantic_core import ValidationError
 
-from src.app.runtime.config.config_data import ConfigData
+from src.app.runtime.config.config_data import DEV_ENVIRONMENTS, ConfigData
 
+# Matches ${...} placeholders
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
 
-def substitute_env_vars(text: str) -> str:
+# Variables validate_config_env_vars() reports when unset or empty
+_REQUIRED_ENV_VARS = {
+    "OIDC_KEYCLOAK_CLIENT_ID": "Keycloak OAuth client ID",
+    "OIDC_KEYCLOAK_CLIENT_SECRET": "Keycloak OAuth client secret",
+}
+
+
+def substitute_env_vars(text: str, env: Mapping[str, str] | None = None) -> str:
     """
     Substitute environment variable placeholders in text.
 
@@ -19,19 +28,24 @@ def substitute_env_vars(text: str) -> str:
     - ${VAR_NAME} - required variable (raises error if missing)
     - ${VAR_NAME:-default} - optional with default value
     - ${VAR_NAME:?error_message} - required with custom error message
+
+    Variables are read from ``env`` when given, otherwise from ``os.environ``.
     """
+    if env is None:
+        env = os.environ
+
     def replacer(match):
         var_expr = match.group(1)
 
         # Handle default values: ${VAR:-default}
         if ":-" in var_expr:
             var_name, default = var_expr.split(":-", 1)
-            return os.getenv(var_name, default)
+            return env.get(var_name, default)
 
         # Handle error messages: ${VAR:?message}
         elif ":?" in var_expr:
             var_name, error_msg = var_expr.split(":?", 1)
-            value = os.getenv(var_name)
+            value = env.get(var_name)
             if value is None:
                 raise ValueError(f"Required environment variable {var_name}: {error_msg}")
             return value
@@ -39,14 +53,25 @@ def substitute_env_vars(text: str) -> str:
         # Handle required variables: ${VAR}
         else:
             var_name = var_expr
-            value = os.getenv(var_name)
+            value = env.get(var_name)
             if value is None:
                 raise ValueError(f"Required environment variable {var_name} not set")
             return value
 
-    # Match ${...} patterns
-    pattern = r'\$\{([^}]+)\}'
-    return re.sub(pattern, replacer, text)
+    return _ENV_VAR_RE.sub(replacer, text)
+
+
+def _environment_overrides(env_mode: str) -> dict[str, str]:
+    """Collect ``<ENV_MODE>_*`` variables keyed by their unprefixed name.
+
+    Makes a single pass over ``os.environ`` with the prefix computed once.
+    """
+    prefix = f"{env_mode.upper()}_"
+    return {
+        name.removeprefix(prefix): value
+        for name, value in os.environ.items()
+        if name.startswith(prefix)
+    }
 
 
 def load_templated_yaml(file_path: Path) -> ConfigData:
@@ -72,23 +97,22 @@ def load_templated_yaml(file_path: Path) -> ConfigData:
     env_mode = os.getenv("APP_ENVIRONMENT", "development")
     logger.info(f"Loading configuration for environment: {env_mode}")
 
-    # Iterate through all environment variables with the prefix matching the env_mode and return (name, value) pairs of all matching variables
-    env_variables = [(var, value) for var, value in os.environ.items() if var.startswith(f"{env_mode.upper()}_")]
-    logger.info(f"Applying environment-specific overrides: {env_variables}")
+    # Promote environment-prefixed variables (e.g. PRODUCTION_HOST -> HOST)
+    overrides = _environment_overrides(env_mode)
+    if overrides:
+        logger.info(f"Applying environment-specific overrides: {overrides}")
+        os.environ.update(overrides)
 
-    # Now create new environment variables from the matching variables above by removing the prefix
-    for var_name, var_value in env_variables:
-        new_var_name = var_name[len(f"{env_mode.upper()}_"):]
+    # Substitute environment variables from one snapshot of the environment
+    substituted_content = substitute_env_vars(content, dict(os.environ))
 
-        os.environ[new_var_name] = var_value
-        logger.debug(f"Set environment variable {new_var_name} from {var_name}")
+    # Parse YAML. PyYAML is imported here so importing this module stays cheap;
+    # CSafeLoader (libyaml) only exists when PyYAML was built against it.
+    import yaml
 
-    # Substitute environment variables
-    substituted_content = substitute_env_vars(content)
-
-    # Parse YAML
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        loaded = yaml.safe_load(substituted_content)
+        loaded = yaml.load(substituted_content, Loader=loader)
         if not loaded:
             raise ValueError("Failed to parse YAML")
     except yaml.YAMLError as e:
@@ -98,7 +122,9 @@ def load_templated_yaml(file_path: Path) -> ConfigData:
     try:
         # Extract the 'config' section from the YAML structure
         config_data = loaded.get('config', {})
-        config = ConfigData(**config_data)
+        # ConfigData's validator is compiled once at class creation; hand it the
+        # parsed mapping directly instead of unpacking it into keyword arguments
+        config = ConfigData.model_validate(config_data)
     except ValidationError as e:
         raise ValueError(f"Invalid configuration: {e}") from e
 
@@ -108,7 +134,7 @@ def load_templated_yaml(file_path: Path) -> ConfigData:
         enabled_providers = {}
         for name, provider in config.oidc.providers.items():
             if provider.enabled:
-                if provider.dev_only and (env_mode != "development" and env_mode != "test"):
+                if provider.dev_only and env_mode not in DEV_ENVIRONMENTS:
                     logger.info(f"Skipping OIDC provider '{name}' in non-development environment")
                     continue
                 enabled_providers[name] = provider
@@ -124,25 +150,24 @@ def load_templated_yaml(file_path: Path) -> ConfigData:
     return config
 
 
-def validate_config_env_vars() -> dict[str, str]:
+def validate_config_env_vars(env: Mapping[str, str] | None = None) -> dict[str, str]:
     """
     Validate that all required environment variables are set.
 
+    Args:
+        env: Variables to check; defaults to ``os.environ``
+
     Returns:
         Dictionary of missing variables and their descriptions
     """
-    required_vars = {
-        'OIDC_KEYCLOAK_CLIENT_ID': 'Keycloak OAuth client ID',
-        'OIDC_KEYCLOAK_CLIENT_SECRET': 'Keycloak OAuth client secret',
+    if env is None:
+        env = os.environ
+    return {
+        var: description
+        for var, description in _REQUIRED_ENV_VARS.items()
+        if not env.get(var)
     }
 
-    missing = {}
-    for var, description in required_vars.items():
-        if not os.getenv(var):
-            missing[var] = description
-
-    return missing
-
 
 # Example usage
 if __name__ == "__main__":
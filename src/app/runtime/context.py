@@ -1,6 +1,7 @@
-from contextlib import contextmanager
+from collections.abc import Callable
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, replace
+from functools import wraps
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -165,8 +166,55 @@ def _merge_configs(base_config: ConfigData, override_config: ConfigData) -> Conf
     return ConfigData.model_validate(merged_dict)
 
 
-@contextmanager
-def with_context(config_override: ConfigData | None = None):
+class _ContextOverride:
+    """Context manager and decorator returned by :func:`with_context`.
+
+    A plain class rather than a ``@contextmanager`` generator, so entering
+    and leaving a context doesn't create and drive a generator. An instance
+    can't be entered again while it is active; used as a decorator, each
+    call gets a fresh instance.
+    """
+
+    __slots__ = ("_config_override", "_token")
+
+    def __init__(self, config_override: ConfigData | None) -> None:
+        self._config_override = config_override
+        self._token: Token[AppContext] | None = None
+
+    def __call__[**P, R](self, func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            with _ContextOverride(self._config_override):
+                return func(*args, **kwargs)
+
+        return inner
+
+    def __enter__(self) -> None:
+        if self._token is not None:
+            raise RuntimeError("with_context() override is already active")
+
+        config_override = self._config_override
+        if config_override is None:
+            # No overrides, just keep the current context
+            return
+
+        if not isinstance(config_override, ConfigData):
+            raise ValueError(
+                f"config_override must be ConfigData, or None, got {type(config_override)}"
+            )
+
+        context = get_context()
+        # Get only explicitly set fields recursively using our custom function
+        merged_config = _merge_configs(context.config, config_override)
+        self._token = set_context(replace(context, config=merged_config))
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            _app_context.reset(self._token)
+            self._token = None
+
+
+def with_context(config_override: ConfigData | None = None) -> _ContextOverride:
     """Context manager for temporarily overriding the application context.
 
     This function merges the override configuration with the current context,
@@ -195,27 +243,13 @@ def with_context(config_override: ConfigData | None = None):
         with with_context(override_config):
             config = get_config()
             # config.jwt.uid_claim is 'custom_uid', other jwt fields inherited
-    """
-    if config_override is None:
-        # No overrides, just yield current context
-        yield
-        return
 
-    current_config = get_context().config
-
-    if isinstance(config_override, ConfigData):
-        # Get only explicitly set fields recursively using our custom function
-        merged_config = _merge_configs(current_config, config_override)
-    else:
-        raise ValueError(
-            f"config_override must be ConfigData, or None, got {type(config_override)}"
-        )
-
-    token = set_context(replace(get_context(), config=merged_config))
-    try:
-        yield
-    finally:
-        _app_context.reset(token)
+        # As a decorator, each call runs under the override
+        @with_context(override_config)
+        def handler():
+            ...
+    """
+    return _ContextOverride(config_override)
 
 
 def set_config(config: ConfigData) -> None:
@@ -277,31 +277,25 @@ def auth_test_client(auth_test_config: ConfigData, session: Session, jwks_servic
         app.dependency_overrides.clear()
 
 
-# Mock Response Factories
-@pytest.fixture
-def mock_http_response_factory():
-    """Factory for creating mock HTTP responses."""
-    from unittest.mock import Mock
+# Mock Transport Factories
+@pytest.fixture(scope="module")
+def mock_http_transport_factory():
+    """Factory for httpx mock transports that record the requests they serve.
 
+    Module-scoped: the factory itself is stateless, and every transport it
+    creates keeps its own request log.
+    """
     import httpx
 
-    def create_response(json_data: dict, status_code: int = 200) -> Mock:
-        mock_response = Mock()
-        mock_response.json.return_value = json_data
-        mock_response.status_code = status_code
-
-        def raise_for_status():
-            if status_code >= 400:
-                mock_request = Mock(spec=httpx.Request)
-                mock_response_obj = Mock(spec=httpx.Response)
-                mock_response_obj.status_code = status_code
-                raise httpx.HTTPStatusError(
-                    f"HTTP {status_code}",
-                    request=mock_request,
-                    response=mock_response_obj,
-                )
-
-        mock_response.raise_for_status = raise_for_status
-        return mock_response
-
-    return create_response
+    def create_transport(json_data: dict, status_code: int = 200) -> httpx.MockTransport:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(status_code, json=json_data)
+
+        transport = httpx.MockTransport(handler)
+        transport.requests = requests  # type: ignore[attr-defined]
+        return transport
+
+    return create_transport
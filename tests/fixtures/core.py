@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
+from authlib.jose import jwt
 from fastapi import Response
 from sqlalchemy import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
@@ -78,6 +81,33 @@ def oidc_provider_config() -> OIDCProviderConfig:
     )
 
 
+@pytest.fixture
+def token_factory() -> Callable[..., str]:
+    """Factory of HS256 test tokens signed with the shared test key.
+
+    Each call mints a fresh token, so ``iat``/``exp`` are relative to the
+    moment the test asks for it.
+    """
+
+    def _make_token(
+        *,
+        issuer: str | None,
+        audience: str | list[str],
+        kid: str | None = _KID,
+        secret: bytes = _HS_KEY,
+        extra_claims: dict[str, Any] | None = None,
+    ) -> str:
+        now = int(time.time())
+        payload: dict[str, Any] = {"aud": audience, "iat": now, "exp": now + 3600}
+        if issuer is not None:
+            payload["iss"] = issuer
+        payload.update(extra_claims or {})
+        header = {"alg": "HS256", **({"kid": kid} if kid else {})}
+        return jwt.encode(header, payload, secret).decode()
+
+    return _make_token
+
+
 @pytest.fixture
 def request_factory() -> Callable[[dict[str, str]], Request]:
     def _make_request(headers: dict[str, str]) -> Request:
@@ -125,6 +155,13 @@ def persistent_session() -> Generator[Session]:
         yield session
 
 
+@pytest.fixture(scope="session")
+def thread_pool() -> Generator[ThreadPoolExecutor]:
+    """Worker threads shared by every test that needs real threads."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
 @pytest.fixture
 def session() -> Generator[Session]:
     """Create a fresh database session for testing."""
@@ -31,3 +31,36 @@ class DummyAsyncClient:
 class FailingAsyncClient(DummyAsyncClient):
     async def __aenter__(self):  # pragma: no cover - defensive helper
         raise AssertionError("Should not fetch when JWKS is cached")
+
+
+class RecordingAsyncClient:
+    """Stand-in for ``httpx.AsyncClient`` that serves one canned outcome.
+
+    Calls are recorded as ``(args, kwargs)`` tuples in ``get_calls`` and
+    ``post_calls``; pass ``error`` to raise it from every request instead.
+    """
+
+    def __init__(self, response=None, *, error: Exception | None = None):
+        self._response = response
+        self._error = error
+        self.get_calls: list[tuple[tuple, dict]] = []
+        self.post_calls: list[tuple[tuple, dict]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def get(self, *args, **kwargs):
+        self.get_calls.append((args, kwargs))
+        return self._respond()
+
+    async def post(self, *args, **kwargs):
+        self.post_calls.append((args, kwargs))
+        return self._respond()
+
+    def _respond(self):
+        if self._error is not None:
+            raise self._error
+        return self._response
@@ -219,9 +219,7 @@ class TestWithoutKeycloak:
         with patch(
             "src.app.core.services.oidc_client_service.httpx.AsyncClient"
         ) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = (
-                Exception("Connection error")
-            )
+            mock_client.return_value.post.side_effect = Exception("Connection error")
 
             response = integration_client.get(
                 "/auth/web/login",
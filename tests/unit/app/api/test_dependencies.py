@@ -319,25 +319,12 @@ class TestEnforceOrigin:
             # Should not raise any exception
             enforce_origin(request)
 
-    def test_enforce_origin_skips_development_mode(self):
-        """Test that development mode skips origin enforcement."""
+    @pytest.mark.parametrize("environment", ["development", "test"])
+    def test_enforce_origin_skips_non_production_modes(self, environment):
+        """Test that development and test modes skip origin enforcement."""
         config = ConfigData()
         config.app = AppConfig()
-        config.app.environment = "development"
-        config.app.cors = CORSConfig()
-        config.app.cors.origins = []
-
-        request = self.create_mock_request(method="POST", origin="https://evil.com")
-
-        with with_context(config_override=config):
-            # Should not raise any exception
-            enforce_origin(request)
-
-    def test_enforce_origin_skips_test_mode(self):
-        """Test that test mode skips origin enforcement."""
-        config = ConfigData()
-        config.app = AppConfig()
-        config.app.environment = "test"
+        config.app.environment = environment
         config.app.cors = CORSConfig()
         config.app.cors.origins = []
 
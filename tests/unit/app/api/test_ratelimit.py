@@ -5,14 +5,25 @@ from unittest.mock import Mock
 import pytest
 from fastapi import HTTPException, Request
 from fastapi_limiter.depends import RateLimiter
+from starlette.datastructures import URL, Address, State
 
 from src.app.api.http.app import FastAPILimiter, configure_rate_limiter
+from src.app.api.http.middleware import limiter as limiter_module
 from src.app.api.http.middleware.limiter import (
     DefaultLocalRateLimiter,
     get_rate_limiter,
 )
 from src.app.runtime.config.config_data import ConfigData
 from src.app.runtime.context import get_config, set_config, with_context
+from tests.utils import attr_snapshot
+
+
+@pytest.fixture(autouse=True)
+def restore_limiter_state():
+    """Put back the globally configured limiter factory after each test."""
+    with attr_snapshot(limiter_module, "_rate_limiter_factory"):
+        yield
+    limiter_module._create_rate_limiter.cache_clear()
 
 
 class TestRateLimiting:
@@ -25,6 +36,11 @@ class TestRateLimiting:
         #set_config(test_config)
         return test_config
 
+    @pytest.fixture
+    def fake_clock(self) -> dict[str, float]:
+        """Mutable monotonic clock driving the local limiter."""
+        return {"t": 0.0}
+
     @pytest.fixture(
         params=[
             "local",
@@ -37,7 +53,7 @@ class TestRateLimiting:
             ),
         ]
     )
-    async def rate_limiter_type(self, test_config, request):
+    async def rate_limiter_type(self, test_config, fake_clock, request):
         """Parametrized fixture that provides both local and redis rate limiters."""
         with with_context(test_config):
             limiter_type = request.param
@@ -48,7 +64,11 @@ class TestRateLimiting:
                     times: int, milliseconds: int, per_endpoint: bool, per_method: bool
                 ):
                     return DefaultLocalRateLimiter(
-                        times, milliseconds, per_endpoint, per_method
+                        times,
+                        milliseconds,
+                        per_endpoint,
+                        per_method,
+                        time_func=lambda: fake_clock["t"],
                     )
 
                 configure_rate_limiter(local_factory)
@@ -68,6 +88,18 @@ class TestRateLimiting:
 
         return _get_limiter
 
+    @pytest.fixture
+    def advance_time(self, rate_limiter_type, fake_clock):
+        """Let ``seconds`` pass: instantly for the local limiter, for real on Redis."""
+
+        async def _advance(seconds: float) -> None:
+            if rate_limiter_type == "local":
+                fake_clock["t"] += seconds
+            else:
+                await asyncio.sleep(seconds)
+
+        return _advance
+
     @pytest.fixture
     async def redis_setup(self, rate_limiter_type):
         """Setup Redis connection if needed for Redis rate limiter tests."""
@@ -112,26 +144,34 @@ class TestRateLimiting:
             assert limiter.milliseconds is not None
 
     @pytest.fixture
-    def mock_request(self):
-        """Create a mock request for testing."""
-        request = Mock(spec=Request)
-        request.client = Mock()
-        request.client.host = "127.0.0.1"
-        request.state = Mock()
-        request.scope = {"route": None, "path": "/test"}
-        request.method = "GET"
-        request.url = Mock()
-        request.url.path = "/test"
+    def make_request(self):
+        """Factory for mock requests from a given client host."""
+
+        def _make_request(host: str = "127.0.0.1"):
+            request = Mock(spec=Request)
+            request.client = Address(host, 0)
+            request.state = State()
+            request.scope = {"route": None, "path": "/test"}
+            request.method = "GET"
+            request.url = URL("/test")
+
+            # Add mock app with routes for fastapi-limiter compatibility
+            request.app = Mock()
+            request.app.routes = []  # Empty routes list for testing
+
+            # Add mock headers for fastapi-limiter identifier
+            request.headers = Mock()
+            # No forwarded headers by default
+            request.headers.get = Mock(return_value=None)
 
-        # Add mock app with routes for fastapi-limiter compatibility
-        request.app = Mock()
-        request.app.routes = []  # Empty routes list for testing
+            return request
 
-        # Add mock headers for fastapi-limiter identifier
-        request.headers = Mock()
-        request.headers.get = Mock(return_value=None)  # No forwarded headers by default
+        return _make_request
 
-        return request
+    @pytest.fixture
+    def mock_request(self, make_request):
+        """Create a mock request for testing."""
+        return make_request()
 
     @pytest.mark.asyncio
     async def test_rate_limiting_within_limits(
@@ -142,8 +182,9 @@ class TestRateLimiting:
         response = Mock()
 
         # Should allow first few requests
-        for _ in range(5):
-            await limiter(mock_request, response)
+        await asyncio.gather(
+            *(limiter(mock_request, response) for _ in range(5))
+        )
 
     @pytest.mark.asyncio
     async def test_rate_limiting_exceeds_limits(
@@ -164,7 +205,7 @@ class TestRateLimiting:
 
     @pytest.mark.asyncio
     async def test_rate_limiting_time_window_reset(
-        self, get_limiter, mock_request, redis_setup
+        self, get_limiter, mock_request, redis_setup, advance_time
     ):
         """Test rate limits reset after time window expires."""
         limiter = get_limiter(1, 1000)  # 1 request per 1 second
@@ -178,43 +219,33 @@ class TestRateLimiting:
             await limiter(mock_request, response)
 
         # Wait for window to expire
-        await asyncio.sleep(1.1)
+        await advance_time(1.1)
 
         # Should allow request again after window reset
         await limiter(mock_request, response)
 
     @pytest.mark.asyncio
-    async def test_rate_limiting_different_clients(self, get_limiter, redis_setup):
+    async def test_local_rate_limiter_default_clock(self, mock_request):
+        """Smoke test: with its default clock the local limiter blocks a repeat hit."""
+        limiter = DefaultLocalRateLimiter(1, 60000, False, False)
+        response = Mock()
+
+        await limiter(mock_request, response)
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(mock_request, response)
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_rate_limiting_different_clients(
+        self, get_limiter, make_request, redis_setup
+    ):
         """Test rate limiting per client IP address."""
         limiter = get_limiter(1, 60000)
         response = Mock()
 
         # Create requests from different IPs
-        request1 = Mock(spec=Request)
-        request1.client = Mock()
-        request1.client.host = "192.168.1.1"
-        request1.state = Mock()
-        request1.scope = {"route": None, "path": "/test"}
-        request1.method = "GET"
-        request1.url = Mock()
-        request1.url.path = "/test"
-        request1.app = Mock()
-        request1.app.routes = []
-        request1.headers = Mock()
-        request1.headers.get = Mock(return_value=None)
-
-        request2 = Mock(spec=Request)
-        request2.client = Mock()
-        request2.client.host = "192.168.1.2"
-        request2.state = Mock()
-        request2.scope = {"route": None, "path": "/test"}
-        request2.method = "GET"
-        request2.url = Mock()
-        request2.url.path = "/test"
-        request2.app = Mock()
-        request2.app.routes = []
-        request2.headers = Mock()
-        request2.headers.get = Mock(return_value=None)
+        request1 = make_request("192.168.1.1")
+        request2 = make_request("192.168.1.2")
 
         # Each client should be able to make one request
         await limiter(request1, response)
@@ -227,6 +258,20 @@ class TestRateLimiting:
         with pytest.raises(HTTPException):
             await limiter(request2, response)
 
+    def test_local_rate_limiter_keys_by_uid_then_ip(self, make_request):
+        """Authenticated requests are keyed by uid, anonymous ones by client IP."""
+        limiter = DefaultLocalRateLimiter(1, 1000, False, False)
+        request = make_request("10.0.0.1")
+
+        assert limiter._make_key(request, per_endpoint=False, per_method=False) == (
+            "ip:10.0.0.1"
+        )
+
+        request.state.uid = "user-123"
+        assert limiter._make_key(request, per_endpoint=False, per_method=False) == (
+            "user:user-123"
+        )
+
     @pytest.mark.asyncio
     async def test_rate_limiting_boundary_conditions(
         self, get_limiter, mock_request, redis_setup
@@ -236,8 +281,9 @@ class TestRateLimiting:
         response = Mock()
 
         # Should allow exactly 3 requests
-        for _ in range(3):
-            await limiter(mock_request, response)
+        await asyncio.gather(
+            *(limiter(mock_request, response) for _ in range(3))
+        )
 
         # 4th request should be blocked
         with pytest.raises(HTTPException) as exc_info:
@@ -276,7 +322,7 @@ class TestRateLimiting:
 
     @pytest.mark.asyncio
     async def test_rate_limit_persists_until_window_expires(
-        self, get_limiter, mock_request, redis_setup
+        self, get_limiter, mock_request, redis_setup, advance_time
     ):
         """Should continue blocking requests until the full window expires."""
         limiter = get_limiter(2, 5000)  # 2 requests per 5 seconds
@@ -286,21 +332,23 @@ class TestRateLimiting:
         response = Mock()
 
         # Exceed the limit
-        for _ in range(2):
-            await limiter(mock_request, response)
+        await asyncio.gather(
+            *(limiter(mock_request, response) for _ in range(2))
+        )
 
         with pytest.raises(HTTPException):
             await limiter(mock_request, response)
 
         # Wait for partial window reset (should still be blocked)
-        await asyncio.sleep(4)
+        await advance_time(4)
         with pytest.raises(HTTPException):
             await limiter(mock_request, response)
 
         # Wait for full window reset
-        await asyncio.sleep(1)
-        for _ in range(2):
-            await limiter(mock_request, response)
+        await advance_time(1)
+        await asyncio.gather(
+            *(limiter(mock_request, response) for _ in range(2))
+        )
 
         # Should be blocked again after limit
         with pytest.raises(HTTPException):
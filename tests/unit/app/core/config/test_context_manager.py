@@ -1,7 +1,9 @@
 """Unit tests for the async context manager system."""
 
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import Any
 
 import pytest
@@ -204,8 +206,8 @@ class TestAsyncContextManager:
             worker_config.app.host = f"worker_{worker_id}_host"
 
             with with_context(worker_config):
-                # Simulate some async work
-                await asyncio.sleep(0.01)
+                # Yield to the other workers while inside the context
+                await asyncio.sleep(0)
                 return get_config().app.host
 
         # Run multiple async workers concurrently
@@ -230,7 +232,7 @@ class TestAsyncContextManager:
             level2_config.app.host = "level2_async_host"
 
             with with_context(level2_config):
-                await asyncio.sleep(0.01)
+                await asyncio.sleep(0)
                 return get_config().app.host, str(get_config().app.port)
 
         # Level 1 context
@@ -261,7 +263,8 @@ class TestAsyncContextManager:
     @pytest.mark.asyncio
     async def test_async_context_with_concurrent_tasks(self):
         """Should maintain context isolation with concurrent async tasks."""
-        results = {}
+        original_config = get_config()
+        results: list[dict[str, Any] | None] = [None] * 6  # indexed by id 1-5
 
         async def async_task(task_id: int) -> None:
             """Async task that works in its own context."""
@@ -271,8 +274,9 @@ class TestAsyncContextManager:
             task_config.app.port = 8000 + task_id
 
             with with_context(task_config):
-                # Simulate varying amounts of async work
-                await asyncio.sleep(0.01 * task_id)
+                # Suspend a varying number of times so tasks finish interleaved
+                for _ in range(task_id):
+                    await asyncio.sleep(0)
 
                 # Store results from this task's context
                 results[task_id] = {
@@ -280,9 +284,10 @@ class TestAsyncContextManager:
                     "port": get_config().app.port,
                 }
 
-        # Start multiple concurrent tasks
-        tasks = [async_task(i) for i in range(1, 6)]
-        await asyncio.gather(*tasks)
+        # Start multiple concurrent tasks; each runs in a copy of this context
+        async with asyncio.TaskGroup() as tg:
+            for i in range(1, 6):
+                tg.create_task(async_task(i))
 
         # Each task should have seen its own context
         for i in range(1, 6):
@@ -290,14 +295,19 @@ class TestAsyncContextManager:
             expected_port = 8000 + i
             assert results[i]["port"] == expected_port
 
+        # No task's override leaks back into the parent context
+        assert get_config() is original_config
+
 
 class TestThreadSafety:
     """Test context manager behavior across threads."""
 
-    def test_thread_isolation(self):
+    def test_thread_isolation(self, thread_pool: ThreadPoolExecutor):
         """Should maintain context isolation across threads."""
         original_config = get_config()
-        results = {}
+        results: list[dict[str, Any] | None] = [None] * 6  # indexed by id 1-5
+        # All workers hold their context at the same time before reading it
+        all_inside = threading.Barrier(5)
 
         def thread_worker(worker_id: int) -> None:
             """Worker function that runs in its own thread."""
@@ -307,10 +317,7 @@ class TestThreadSafety:
             worker_config.app.port = 8000 + worker_id
 
             with with_context(worker_config):
-                # Simulate some work
-                import time
-
-                time.sleep(0.01)
+                all_inside.wait(timeout=5)
 
                 # Store results from this thread's context
                 results[worker_id] = {
@@ -319,12 +326,11 @@ class TestThreadSafety:
                 }
 
         # Run workers in separate threads
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(thread_worker, i) for i in range(1, 6)]
+        futures = [thread_pool.submit(thread_worker, i) for i in range(1, 6)]
 
-            # Wait for all threads to complete
-            for future in futures:
-                future.result()
+        # Wait for all threads to complete
+        for future in futures:
+            future.result()
 
         # Each thread should have seen its own context
         for i in range(1, 6):
@@ -336,10 +342,8 @@ class TestThreadSafety:
 
     def test_mixed_async_and_thread_contexts(self):
         """Should handle mixed async and thread contexts correctly."""
-        import threading
-        import time
-
         results = []
+        main_recorded = threading.Event()
 
         def thread_function():
             """Function that runs in a separate thread."""
@@ -347,7 +351,8 @@ class TestThreadSafety:
             thread_config.app.host = "thread_host"
 
             with with_context(thread_config):
-                time.sleep(0.02)  # Simulate work
+                # Stay inside the context until the main thread has read its own
+                main_recorded.wait(timeout=5)
                 results.append(("thread", get_config().app.host))
 
         # Start thread context
@@ -364,6 +369,7 @@ class TestThreadSafety:
 
             # Record main thread context while thread is running
             results.append(("main_during", get_config().app.host))
+            main_recorded.set()
 
             # Wait for thread to complete
             thread.join()
@@ -411,42 +417,78 @@ class TestContextManagerEdgeCases:
         original_config = get_config()
         depth = 50  # Deep nesting
 
-        def create_nested_context(level: int) -> str:
-            """Recursively create nested contexts."""
-            if level == 0:
-                return get_config().app.host
+        configs = [ConfigData() for _ in range(depth)]
+        with ExitStack() as stack:
+            # Enter from the outermost level (deep_50) down to the innermost
+            for level, config in zip(range(depth, 0, -1), configs, strict=True):
+                config.app.host = f"deep_{level}"
+                stack.enter_context(with_context(config))
 
-            config = ConfigData()
-            config.app.host = f"deep_{level}"
+            assert get_config().app.host == "deep_1"  # Deepest level
 
-            with with_context(config):
-                return create_nested_context(level - 1)
+        # Should be back to original
+        assert get_config() is original_config
+
+    @pytest.mark.parametrize("depth", [1, 3, 5, 10])
+    def test_context_manager_reentrance(self, depth: int):
+        """Should handle reentrant context manager calls with the same config."""
+        original_config = get_config()
 
-        result = create_nested_context(depth)
-        assert result == "deep_1"  # Deepest level
+        test_config = ConfigData()
+        test_config.app.host = "reentrant_host"
+
+        with ExitStack() as stack:
+            for _ in range(depth):
+                stack.enter_context(with_context(test_config))
+                assert get_config().app.host == "reentrant_host"
 
         # Should be back to original
         assert get_config() is original_config
 
-    def test_context_manager_reentrance(self):
-        """Should handle reentrant context manager calls."""
+    def test_with_context_rejects_non_config_override(self):
+        """Should reject overrides that are not ConfigData on entry."""
         original_config = get_config()
 
+        with pytest.raises(ValueError, match="config_override must be ConfigData"):
+            with with_context({"app": {"host": "dict_host"}}):  # type: ignore[arg-type]
+                pass
+
+        assert get_config() is original_config
+
+    def test_with_context_rejects_reentry(self):
+        """Should refuse to enter the same override instance twice."""
+        original_config = get_config()
         test_config = ConfigData()
-        test_config.app.host = "reentrant_host"
+        test_config.app.host = "reentry_host"
 
-        with with_context(test_config):
-            assert get_config().app.host == "reentrant_host"
+        override = with_context(test_config)
+        with override:
+            with pytest.raises(RuntimeError, match="already active"):
+                with override:
+                    pass
+            assert get_config().app.host == "reentry_host"
 
-            # Reentrant call with same config
-            with with_context(test_config):
-                assert get_config().app.host == "reentrant_host"
+        assert get_config() is original_config
 
-                # Another level
-                with with_context(test_config):
-                    assert get_config().app.host == "reentrant_host"
+        # Once exited, the instance can be entered again
+        with override:
+            assert get_config().app.host == "reentry_host"
+        assert get_config() is original_config
 
-        # Should be back to original
+    def test_with_context_as_decorator(self):
+        """Should apply the override around each call of a decorated function."""
+        original_config = get_config()
+        test_config = ConfigData()
+        test_config.app.host = "decorated_host"
+
+        @with_context(test_config)
+        def read_host(depth: int) -> list[str]:
+            hosts = [get_config().app.host]
+            if depth:
+                hosts += read_host(depth - 1)
+            return hosts
+
+        assert read_host(2) == ["decorated_host"] * 3
         assert get_config() is original_config
 
     def test_context_inheritance_partial_override(self):
@@ -47,6 +47,12 @@ class TestAuthSession:
         session.mark_used()
         assert session.used
 
+    def test_auth_session_has_no_instance_dict(self, test_auth_session):
+        """Test sessions are slotted and reject unknown attributes."""
+        assert not hasattr(test_auth_session, "__dict__")
+        with pytest.raises(AttributeError):
+            test_auth_session.unknown = "value"
+
 
 
 class TestUserSession:
@@ -85,7 +91,7 @@ class TestUserSession:
 
         updated_time = original_time + 2000
 
-        with patch("time.time", return_value=updated_time):
+        with patch("src.app.core.models.session.current_time", return_value=updated_time):
             session.update_access()
 
         assert session.last_accessed_at > original_time
@@ -99,7 +105,7 @@ class TestUserSession:
         rotation_time = initial_time + 1000
 
 
-        with patch("time.time", return_value=rotation_time):
+        with patch("src.app.core.models.session.current_time", return_value=rotation_time):
             session.rotate_session_id("new-id")
 
         assert session.id == "new-id"
@@ -113,7 +119,7 @@ class TestUserSession:
         update_time = initial_time + 1000
 
 
-        with patch("time.time", return_value=update_time):
+        with patch("src.app.core.models.session.current_time", return_value=update_time):
             session.update_tokens(
                 access_token="new-access",
                 refresh_token="new-refresh",
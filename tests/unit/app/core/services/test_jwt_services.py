@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from unittest.mock import Mock, patch
 
 import httpx
 import pytest
@@ -18,6 +19,7 @@ from src.app.runtime.config.config_data import (
     OIDCProviderConfig,
 )
 from src.app.runtime.context import with_context
+from tests.fixtures.dummies import DummyResponse, RecordingAsyncClient
 from tests.utils import oct_jwk
 
 
@@ -276,35 +278,26 @@ class TestJWTService:
         self, jwks_data, oidc_provider_config, jwks_service: JwksService
     ):
         """Should fetch and cache JWKS successfully."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = Mock()
-            mock_response.json.return_value = jwks_data
-            mock_response.raise_for_status = Mock()
-
-            # Only the .get() call is async
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-
+        client = RecordingAsyncClient(DummyResponse(jwks_data))
+        with patch.object(jwks_service, "_get_client", return_value=client):
             result = await jwks_service.fetch_jwks(oidc_provider_config)
 
-            assert result == jwks_data
+        assert result == jwks_data
         # Verify the correct URL was called
-        mock_client.return_value.__aenter__.return_value.get.assert_called_once_with(
-            "https://test.issuer/.well-known/jwks.json"
-        )
+        assert client.get_calls == [
+            (("https://test.issuer/.well-known/jwks.json",), {})
+        ]
 
     @pytest.mark.asyncio
     async def test_fetch_jwks_network_timeout(
         self, oidc_provider_config, jwks_service: JwksService
     ):
         """Should handle JWKS fetch network timeouts."""
-        with patch("httpx.AsyncClient") as mock_client:
-            # Simulate timeout
-            mock_client.return_value.__aenter__.return_value.get.side_effect = (
-                httpx.TimeoutException("Request timeout")
-            )
-
+        # Simulate timeout
+        client = RecordingAsyncClient(
+            error=httpx.TimeoutException("Request timeout")
+        )
+        with patch.object(jwks_service, "_get_client", return_value=client):
             with pytest.raises(HTTPException) as exc_info:
                 await jwks_service.fetch_jwks(oidc_provider_config)
 
@@ -316,15 +309,11 @@ class TestJWTService:
         self, oidc_provider_config, jwks_service: JwksService
     ):
         """Should handle invalid JSON in JWKS response."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = Mock()
-            mock_response.json.side_effect = ValueError("Invalid JSON")
-            mock_response.raise_for_status = Mock()
-
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_response = Mock()
+        mock_response.json.side_effect = ValueError("Invalid JSON")
 
+        client = RecordingAsyncClient(mock_response)
+        with patch.object(jwks_service, "_get_client", return_value=client):
             with pytest.raises(HTTPException) as exc_info:
                 await jwks_service.fetch_jwks(oidc_provider_config)
 
@@ -457,13 +446,52 @@ class TestJWTService:
 
         assert result == jwks_data
 
+    @pytest.mark.asyncio
+    async def test_fetch_jwks_refetches_after_ttl(
+        self, jwks_data, oidc_provider_config
+    ):
+        """Should refetch JWKS once the cached entry has expired."""
+        now = [0.0]
+        jwks_service = JwksService(
+            cache=JWKSCacheInMemory(ttl=60, timer=lambda: now[0])
+        )
+
+        client = RecordingAsyncClient(DummyResponse(jwks_data))
+        with patch.object(jwks_service, "_get_client", return_value=client):
+            await jwks_service.fetch_jwks(oidc_provider_config)
+            now[0] = 59.0
+            await jwks_service.fetch_jwks(oidc_provider_config)
+            assert len(client.get_calls) == 1
+
+            now[0] = 61.0
+            await jwks_service.fetch_jwks(oidc_provider_config)
+            assert len(client.get_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_jwks_single_flight(
+        self, jwks_data, oidc_provider_config, jwks_service: JwksService
+    ):
+        """Concurrent cache misses for one issuer should share a single fetch."""
+
+        class SlowClient(RecordingAsyncClient):
+            async def get(self, *args, **kwargs):
+                await asyncio.sleep(0)
+                return await super().get(*args, **kwargs)
+
+        client = SlowClient(DummyResponse(jwks_data))
+        with patch.object(jwks_service, "_get_client", return_value=client):
+            results = await asyncio.gather(
+                *(jwks_service.fetch_jwks(oidc_provider_config) for _ in range(5))
+            )
+
+        assert results == [jwks_data] * 5
+        assert len(client.get_calls) == 1
+
     @pytest.mark.asyncio
     async def test_verify_valid_jwt(
         self,
-        kid_for_jwt,
-        secret_for_jwt_generation,
+        token_factory,
         oidc_provider_config,
-        jwt_generate_service: JwtGeneratorService,
         jwt_verify_service: JwtVerificationService,
     ):
         """Should verify valid JWT successfully."""
@@ -475,14 +503,11 @@ class TestJWTService:
         test_config.jwt.clock_skew = 10
 
         with with_context(config_override=test_config):
-            # Create valid token
-            token = jwt_generate_service.generate_jwt(
+            # Create valid token signed with the key from the JWKS
+            token = token_factory(
                 issuer="https://test.issuer",
-                subject="user-123",
                 audience=oidc_provider_config.client_id,  # Using client_id as audience
-                secret=secret_for_jwt_generation,  # Use the key from the JWKS
-                kid=kid_for_jwt,  # Use the key ID from the JWKS
-                claims={"sub": "user-123"},
+                extra_claims={"sub": "user-123"},
             )
 
             result = await jwt_verify_service.verify_jwt(
@@ -496,34 +521,105 @@ class TestJWTService:
             assert result.subject == "user-123"
 
     @pytest.mark.asyncio
-    async def test_verify_jwt_wrong_audience(
+    async def test_verify_jwt_reuses_cached_result(
         self,
-        oidc_provider_config,
+        auth_test_config,
+        secret_for_jwt_generation,
+        jwt_generate_service: JwtGeneratorService,
+        jwt_verify_service: JwtVerificationService,
+    ):
+        """Should serve a repeated token from the verified cache until cleared."""
+        with with_context(config_override=auth_test_config):
+            token = jwt_generate_service.generate_jwt(
+                subject="user-123", expires_in_seconds=3600
+            )
+            first = await jwt_verify_service.verify_jwt(
+                token, key=secret_for_jwt_generation
+            )
+
+            with patch(
+                "src.app.core.services.jwt.jwt_verify.jwt.decode",
+                side_effect=ValueError("decode should not run"),
+            ):
+                second = await jwt_verify_service.verify_jwt(
+                    token, key=secret_for_jwt_generation
+                )
+                assert second == first
+
+                # Different verification options must not share the entry
+                with pytest.raises(HTTPException):
+                    await jwt_verify_service.verify_jwt(
+                        token, key=secret_for_jwt_generation, expected_nonce="n"
+                    )
+
+                jwt_verify_service.clear_verified_cache()
+                with pytest.raises(HTTPException):
+                    await jwt_verify_service.verify_jwt(
+                        token, key=secret_for_jwt_generation
+                    )
+
+    @pytest.mark.asyncio
+    async def test_verify_jwt_cache_follows_config(
+        self,
+        auth_test_config,
+        secret_for_jwt_generation,
         jwt_generate_service: JwtGeneratorService,
         jwt_verify_service: JwtVerificationService,
     ):
-        """Should reject JWT with wrong audience."""
+        """Should not serve a cached result once the effective config changes."""
+        with with_context(config_override=auth_test_config):
+            token = jwt_generate_service.generate_jwt(
+                subject="user-123", expires_in_seconds=3600
+            )
+            await jwt_verify_service.verify_jwt(token, key=secret_for_jwt_generation)
+
+            stricter_config = ConfigData()
+            stricter_config.jwt.allowed_algorithms = ["RS256"]
+            with with_context(config_override=stricter_config):
+                with pytest.raises(HTTPException, match="Disallowed JWT algorithm"):
+                    await jwt_verify_service.verify_jwt(
+                        token, key=secret_for_jwt_generation
+                    )
+
+    @pytest.mark.parametrize(
+        ("issuer", "audience", "expected_detail"),
+        [
+            (None, "api://test", "missing iss"),
+            ("https://unknown.issuer", "api://test", "jwt error"),
+            ("https://test.issuer", "api://wrong", "aud"),
+        ],
+        ids=["missing_issuer", "unknown_issuer", "wrong_audience"],
+    )
+    @pytest.mark.asyncio
+    async def test_verify_jwt_rejects(
+        self,
+        issuer,
+        audience,
+        expected_detail,
+        token_factory,
+        oidc_provider_config,
+        jwt_verify_service: JwtVerificationService,
+    ):
+        """Should reject JWTs with a missing/unknown issuer or wrong audience."""
         # Create test config with test provider
         test_config = ConfigData()
         test_config.oidc.providers = {"test": oidc_provider_config}
         test_config.jwt.allowed_algorithms = ["HS256"]
         test_config.jwt.audiences = ["api://test"]
         test_config.jwt.clock_skew = 10
+        # Unknown issuers fall back to internal verification with this secret
+        test_config.app.session_signing_secret = "internal-signing-secret"
 
-        with with_context(config_override=test_config):
-            token = jwt_generate_service.generate_jwt(
-                issuer="https://test.issuer",
-                subject="user-123",
-                audience="api://wrong",  # Wrong audience
-                secret="test-secret-key",
-                kid="test-key",
-                claims={"sub": "user-123"},
-            )
+        token = token_factory(
+            issuer=issuer, audience=audience, extra_claims={"sub": "user-123"}
+        )
 
+        with with_context(config_override=test_config):
             with pytest.raises(HTTPException) as exc_info:
                 await jwt_verify_service.verify_jwt(token)
 
-            assert exc_info.value.status_code == 401
+        assert exc_info.value.status_code == 401
+        assert expected_detail in exc_info.value.detail.lower()
 
     @pytest.mark.asyncio
     async def test_verify_jwt_expired_token(
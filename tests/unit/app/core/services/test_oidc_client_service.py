@@ -1,5 +1,6 @@
 import time
 from unittest.mock import patch
+from urllib.parse import parse_qsl
 
 import httpx
 import pytest
@@ -8,14 +9,25 @@ from src.app.core.security import generate_pkce_pair, generate_state
 from src.app.core.services import (
     OidcClientService,
 )
+from src.app.core.services.jwt.jwt_utils import create_token_claims
 from src.app.core.services.jwt.jwt_verify import JwtVerificationService
 from src.app.core.services.oidc_client_service import TokenResponse
-from src.app.runtime.context import with_context
+from src.app.runtime.context import get_config, with_context
+
+
+async def _failing_verify(token, *args, **kwargs):
+    raise Exception("JWT verification failed")
 
 
 class TestOIDCClientService:
     """Test OIDC client functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _auth_context(self, auth_test_config):
+        """Run every test in this class against the auth test configuration."""
+        with with_context(config_override=auth_test_config):
+            yield
+
     def test_generate_pkce_pair(self, oidc_client_service: OidcClientService):
         """Test PKCE verifier and challenge generation."""
         verifier, challenge = generate_pkce_pair()
@@ -39,7 +51,7 @@ class TestOIDCClientService:
 
     @pytest.mark.asyncio
     async def test_exchange_code_for_tokens_success(
-        self, oidc_client_service: OidcClientService, mock_http_response_factory, auth_test_config
+        self, oidc_client_service: OidcClientService, mock_http_transport_factory
     ):
         """Test successful token exchange."""
         mock_response_data = {
@@ -49,14 +61,12 @@ class TestOIDCClientService:
             "refresh_token": "mock-refresh-token",
             "id_token": "mock-id-token",
         }
-        mock_response = mock_http_response_factory(mock_response_data)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.return_value = (
-                mock_response
-            )
+        transport = mock_http_transport_factory(mock_response_data)
 
-            with with_context(config_override=auth_test_config):
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
                 result = await oidc_client_service.exchange_code_for_tokens(
                     code="test-auth-code",
                     pkce_verifier="test-verifier",
@@ -70,17 +80,15 @@ class TestOIDCClientService:
 
     @pytest.mark.asyncio
     async def test_exchange_code_for_tokens_http_error(
-        self, oidc_client_service: OidcClientService, mock_http_response_factory, auth_test_config
+        self, oidc_client_service: OidcClientService, mock_http_transport_factory
     ):
         """Test token exchange with HTTP error."""
-        mock_response = mock_http_response_factory({}, status_code=400)
+        transport = mock_http_transport_factory({}, status_code=400)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.return_value = (
-                mock_response
-            )
-
-            with with_context(config_override=auth_test_config):
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
                 with pytest.raises(httpx.HTTPStatusError):
                     await oidc_client_service.exchange_code_for_tokens(
                         code="test-auth-code",
@@ -91,11 +99,11 @@ class TestOIDCClientService:
 
     @pytest.mark.asyncio
     async def test_exchange_code_for_tokens_with_client_secret(
-        self, oidc_client_service: OidcClientService, mock_http_response_factory, auth_test_config
+        self, oidc_client_service: OidcClientService, mock_http_transport_factory
     ):
         """Test token exchange with client secret authentication."""
         # Configure provider with client secret
-        auth_test_config.oidc.providers["default"].client_secret = "test-secret"
+        get_config().oidc.providers["default"].client_secret = "test-secret"
 
         mock_response_data = {
             "access_token": "mock-access-token",
@@ -103,14 +111,12 @@ class TestOIDCClientService:
             "expires_in": 3600,
             "refresh_token": "mock-refresh-token",
         }
-        mock_response = mock_http_response_factory(mock_response_data)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.return_value = (
-                mock_response
-            )
+        transport = mock_http_transport_factory(mock_response_data)
 
-            with with_context(config_override=auth_test_config):
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
                 result = await oidc_client_service.exchange_code_for_tokens(
                     code="test-auth-code",
                     pkce_verifier="test-verifier",
@@ -121,10 +127,7 @@ class TestOIDCClientService:
                 assert result.access_token == "mock-access-token"
 
                 # Verify client secret was included in Authorization header
-                call_args = (
-                    mock_client.return_value.__aenter__.return_value.post.call_args
-                )
-                headers = call_args[1]["headers"]
+                headers = transport.requests[0].headers
                 assert "Authorization" in headers
                 assert headers["Authorization"].startswith("Basic ")
 
@@ -132,10 +135,10 @@ class TestOIDCClientService:
     async def test_get_user_claims_from_userinfo_endpoint(
         self,
         base_oidc_provider,
-        mock_http_response_factory,
-        auth_test_config,
+        mock_http_transport_factory,
         oidc_client_service: OidcClientService,
         jwt_verify_service: JwtVerificationService,
+        monkeypatch,
     ):
 
         claims = {
@@ -153,61 +156,84 @@ class TestOIDCClientService:
         }
 
         """Test extracting user claims from userinfo endpoint when ID token fails."""
-        mock_response = mock_http_response_factory(claims)
+        transport = mock_http_transport_factory(claims)
+
+        # Make JWT verification fail to force fallback to userinfo
+        monkeypatch.setattr(jwt_verify_service, "verify_jwt", _failing_verify)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
+                result = await oidc_client_service.get_user_claims(
+                    access_token="mock-access-token",
+                    id_token="mock-id-token",
+                    provider="default",
+                )
 
-        with patch.object(jwt_verify_service, "verify_jwt") as mock_verify:
-            # Make JWT verification fail to force fallback to userinfo
-            mock_verify.side_effect = Exception("JWT verification failed")
+                assert result.issuer == 'https://mock-provider.test'
+                assert result.subject == 'user-12345'
+                assert result.audience == "test-client-id"
+                assert result.email == 'test@example.com'
+                assert result.email_verified is True
+                assert result.given_name == 'Test'
+                assert result.family_name == 'User'
+                assert result.name == 'Test User'
+                assert result.custom_claims.get("picture") == "https://example.com/avatar.jpg"
+
+                # Verify userinfo endpoint was called
+                assert len(transport.requests) == 1
+                request_url = str(transport.requests[0].url)
+                assert base_oidc_provider.userinfo_endpoint in request_url
 
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.return_value = (
-                    mock_response
+    @pytest.mark.asyncio
+    async def test_get_user_claims_from_id_token(
+        self,
+        mock_user_claims,
+        mock_http_transport_factory,
+        oidc_client_service: OidcClientService,
+        jwt_verify_service: JwtVerificationService,
+        monkeypatch,
+    ):
+        """Test that a valid ID token is used without calling userinfo."""
+        verified = create_token_claims(token="mock-id-token", claims=mock_user_claims)
+
+        async def fake_verify(token, *args, **kwargs):
+            return verified
+
+        monkeypatch.setattr(jwt_verify_service, "verify_jwt", fake_verify)
+        transport = mock_http_transport_factory(mock_user_claims)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
+                result = await oidc_client_service.get_user_claims(
+                    access_token="mock-access-token",
+                    id_token="mock-id-token",
+                    provider="default",
                 )
 
-                with with_context(config_override=auth_test_config):
-                    result = await oidc_client_service.get_user_claims(
-                        access_token="mock-access-token",
-                        id_token="mock-id-token",
-                        provider="default",
-                    )
-
-                    assert result.issuer == 'https://mock-provider.test'
-                    assert result.subject == 'user-12345'
-                    assert result.audience == "test-client-id"
-                    assert result.email == 'test@example.com'
-                    assert result.email_verified is True
-                    assert result.given_name == 'Test'
-                    assert result.family_name == 'User'
-                    assert result.name == 'Test User'
-                    assert result.custom_claims.get("picture") == "https://example.com/avatar.jpg"
-
-                    # Verify userinfo endpoint was called
-                    mock_client.return_value.__aenter__.return_value.get.assert_called_once()
-                    call_args = (
-                        mock_client.return_value.__aenter__.return_value.get.call_args
-                    )
-                    assert base_oidc_provider.userinfo_endpoint in call_args[0][0]
+        assert result is verified
+        assert transport.requests == []
 
     @pytest.mark.asyncio
-    async def test_get_user_claims_no_id_token_no_userinfo(self, oidc_client_service: OidcClientService, jwt_verify_service: JwtVerificationService, auth_test_config):
+    async def test_get_user_claims_no_id_token_no_userinfo(self, oidc_client_service: OidcClientService, jwt_verify_service: JwtVerificationService, monkeypatch):
         """Test error handling when both ID token and userinfo fail."""
         # Configure provider without userinfo endpoint
-        auth_test_config.oidc.providers["default"].userinfo_endpoint = None
-
-        with patch.object(jwt_verify_service, "verify_jwt") as mock_verify:
-            mock_verify.side_effect = Exception("JWT verification failed")
-
-            with with_context(config_override=auth_test_config):
-                with pytest.raises(ValueError, match="Unable to retrieve user claims"):
-                    await oidc_client_service.get_user_claims(
-                        access_token="mock-access-token",
-                        id_token="mock-id-token",
-                        provider="default",
-                    )
+        get_config().oidc.providers["default"].userinfo_endpoint = None
+        monkeypatch.setattr(jwt_verify_service, "verify_jwt", _failing_verify)
+
+        with pytest.raises(ValueError, match="Unable to retrieve user claims"):
+            await oidc_client_service.get_user_claims(
+                access_token="mock-access-token",
+                id_token="mock-id-token",
+                provider="default",
+            )
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_success(
-        self, oidc_client_service: OidcClientService, mock_http_response_factory, auth_test_config
+        self, oidc_client_service: OidcClientService, mock_http_transport_factory
     ):
         """Test successful access token refresh."""
         mock_response_data = {
@@ -216,14 +242,12 @@ class TestOIDCClientService:
             "expires_in": 3600,
             "refresh_token": "new-refresh-token",
         }
-        mock_response = mock_http_response_factory(mock_response_data)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.return_value = (
-                mock_response
-            )
+        transport = mock_http_transport_factory(mock_response_data)
 
-            with with_context(config_override=auth_test_config):
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
                 result = await oidc_client_service.refresh_access_token(
                     refresh_token="old-refresh-token", provider="default"
                 )
@@ -233,26 +257,21 @@ class TestOIDCClientService:
                 assert result.refresh_token == "new-refresh-token"
 
                 # Verify correct refresh request
-                call_args = (
-                    mock_client.return_value.__aenter__.return_value.post.call_args
-                )
-                form_data = call_args[1]["data"]
+                form_data = dict(parse_qsl(transport.requests[0].content.decode()))
                 assert form_data["grant_type"] == "refresh_token"
                 assert form_data["refresh_token"] == "old-refresh-token"
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_http_error(
-        self, oidc_client_service: OidcClientService, mock_http_response_factory, auth_test_config
+        self, oidc_client_service: OidcClientService, mock_http_transport_factory
     ):
         """Test token refresh with HTTP error."""
-        mock_response = mock_http_response_factory({}, status_code=400)
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.return_value = (
-                mock_response
-            )
+        transport = mock_http_transport_factory({}, status_code=400)
 
-            with with_context(config_override=auth_test_config):
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(
+                oidc_client_service, "_get_client", return_value=client
+            ):
                 with pytest.raises(httpx.HTTPStatusError):
                     await oidc_client_service.refresh_access_token(
                         refresh_token="old-refresh-token", provider="default"
@@ -260,14 +279,14 @@ class TestOIDCClientService:
 
     def test_token_response_expires_at_property(self):
         """Test TokenResponse expires_at property calculation."""
-        import time
-
         token_response = TokenResponse(
             access_token="test-token", token_type="Bearer", expires_in=3600
         )
 
-        # expires_at should be current time + expires_in
-        expected_min = int(time.time()) + 3600 - 2  # Allow 2 seconds tolerance
-        expected_max = int(time.time()) + 3600 + 2
+        # expires_at should be current time + expires_in, read between the two
+        # clock samples taken around the property access
+        before = int(time.time())
+        expires_at = token_response.expires_at
+        after = int(time.time())
 
-        assert expected_min <= token_response.expires_at <= expected_max
+        assert before + 3600 <= expires_at <= after + 3600
@@ -76,6 +76,17 @@ class TestSessionService:
         result = await auth_session_service.get_auth_session(session_id)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_auth_session_rejects_malformed_id(
+        self, auth_session_service: AuthSessionService
+    ):
+        """Test ids of the wrong shape are rejected without a storage lookup."""
+        with patch.object(
+            auth_session_service._storage, "get", new_callable=AsyncMock
+        ) as mock_get:
+            assert await auth_session_service.get_auth_session("nonexistent") is None
+            mock_get.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_user_session_lifecycle(
         self, user_session_service: UserSessionService
@@ -127,13 +138,44 @@ class TestSessionService:
         assert user_session is not None
         initial_time = user_session.last_accessed_at
 
-        # Mock time to return later time for next access
-        with patch("time.time", return_value=base_time + 2):
+        # Advance the ticked clock for the next access
+        with patch("src.app.core.models.session.current_time", return_value=base_time + 2):
             user_session = await user_session_service.get_user_session(session_id)
             assert user_session is not None
             updated_time = user_session.last_accessed_at
             assert updated_time > initial_time
 
+    @pytest.mark.asyncio
+    async def test_user_session_reads_within_a_second_skip_writes(
+        self, user_session_service: UserSessionService
+    ):
+        """Test repeat reads in the same second do not rewrite the session."""
+        session_id = await user_session_service.create_user_session(
+            client_fingerprint="test_fingerprint",
+            user_id="12345678-1234-5678-9abc-123456789012",
+            provider="google",
+        )
+        later = int(time.time()) + 2
+
+        with (
+            patch(
+                "src.app.core.models.session.current_time", return_value=later
+            ),
+            patch.object(
+                user_session_service._storage,
+                "set",
+                wraps=user_session_service._storage.set,
+            ) as mock_set,
+        ):
+            for _ in range(3):
+                user_session = await user_session_service.get_user_session(
+                    session_id
+                )
+                assert user_session is not None
+                assert user_session.last_accessed_at == later
+
+        mock_set.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_provision_user_from_claims_new_user(
         self, user_management_service: UserManagementService
@@ -195,6 +237,32 @@ class TestSessionService:
             assert user.email == "updated@example.com"
             assert user.first_name == "Updated"
 
+    @pytest.mark.asyncio
+    async def test_provision_user_from_claims_orphaned_identity(
+        self,
+        user_management_service: UserManagementService,
+        session,
+        test_user_identity,
+    ):
+        """Test JIT provisioning refuses an identity whose user is missing."""
+        from src.app.entities.core.user_identity import UserIdentityRepository
+
+        # Identity only; its user row was never created
+        UserIdentityRepository(session).create(test_user_identity)
+        session.commit()
+
+        claims = create_token_claims(
+            token="dummy-token",
+            claims={
+                "iss": test_user_identity.issuer,
+                "sub": test_user_identity.subject,
+            },
+        )
+
+        with patch.object(session, "close", return_value=None):
+            with pytest.raises(ValueError, match="identity exists but user not found"):
+                await user_management_service.provision_user_from_claims(claims)
+
     def test_csrf_token_generation_and_validation(self):
         """Test CSRF token generation and validation."""
         session_id = "test-session-123"
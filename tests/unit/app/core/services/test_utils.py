@@ -1,13 +1,16 @@
 import time
 
+import pytest
+
 from src.app.core.services.jwt.jwt_utils import (
     create_token_claims,
     extract_roles,
     extract_scopes,
     extract_uid,
+    lookup_config_by_issuer,
 )
 from src.app.runtime.config.config_data import ConfigData
-from src.app.runtime.context import with_context
+from src.app.runtime.context import get_config, with_context
 
 
 class TestJwtUtils:
@@ -33,91 +36,117 @@ class TestJwtUtils:
         assert claims.given_name == test_user.first_name
         assert claims.family_name == test_user.last_name
 
-    def test_extract_uid_with_custom_claim(self):
-        """Should extract UID from custom claim when configured."""
-        claims = {"iss": "issuer", "sub": "subject", "custom_uid": "user-123"}
-
-        # Create test config with custom uid claim
+    @pytest.mark.parametrize(
+        ("uid_claim", "claims", "expected"),
+        [
+            (
+                "custom_uid",
+                {"iss": "issuer", "sub": "subject", "custom_uid": "user-123"},
+                "user-123",
+            ),
+            (
+                "missing_claim",
+                {"iss": "https://issuer.example", "sub": "user-456"},
+                "https://issuer.example|user-456",
+            ),
+            (
+                "numeric_uid",
+                {"iss": "issuer", "sub": "subject", "numeric_uid": 42},
+                "42",
+            ),
+        ],
+        ids=["custom_claim", "fallback_to_issuer_subject", "non_string_claim"],
+    )
+    def test_extract_uid(self, uid_claim, claims, expected):
+        """Should extract UID from the configured claim or fall back to iss|sub."""
         test_config = ConfigData()
-        test_config.jwt.claims.user_id = "custom_uid"
-
-        with with_context(test_config):
-            result = extract_uid(claims)
-            assert result == "user-123"
+        test_config.jwt.claims.user_id = uid_claim
 
-    def test_extract_uid_fallback_to_issuer_subject(self):
-        """Should fall back to issuer|subject when custom claim missing."""
-        claims = {"iss": "https://issuer.example", "sub": "user-456"}
-
-        # Create test config with missing uid claim
+        with with_context(config_override=test_config):
+            assert extract_uid(claims) == expected
+
+    @pytest.mark.parametrize(
+        ("claims", "expected"),
+        [
+            ({"scope": "read write admin"}, ["read", "write", "admin"]),
+            ({"scp": ["read", "write"]}, ["read", "write"]),
+            ({"scope": "read write", "scp": ["admin"]}, ["read", "write", "admin"]),
+            ({}, []),
+        ],
+        ids=["string", "list", "multiple_sources", "empty"],
+    )
+    def test_extract_scopes(self, claims, expected):
+        """Should parse, combine and dedupe scopes in first-seen order."""
+        assert extract_scopes(claims) == expected
+
+    @pytest.mark.parametrize(
+        ("claims", "expected"),
+        [
+            ({"roles": "user admin"}, ["user", "admin"]),
+            (
+                {"realm_access": {"roles": ["admin", "user"]}, "roles": "guest"},
+                ["admin", "user", "guest"],
+            ),
+            ({"role": "admin"}, ["admin"]),
+            ({"role": "user moderator"}, ["user", "moderator"]),
+            ({"role": "admin", "roles": ["user", "guest"]}, ["admin", "user", "guest"]),
+            ({}, []),
+        ],
+        ids=[
+            "string",
+            "realm_access",
+            "singular_role",
+            "singular_role_space_separated",
+            "role_and_roles",
+            "empty",
+        ],
+    )
+    def test_extract_roles(self, claims, expected):
+        """Should collect roles from flat, singular and nested claim variants."""
+        assert sorted(extract_roles(claims)) == sorted(expected)
+
+    def test_extract_uid_empty_claims(self):
+        """Should handle missing claims gracefully."""
+        assert extract_uid({}) == "None|None"
+
+    def test_lookup_config_by_issuer_follows_active_config(self, oidc_provider_config):
+        """Should resolve issuers against whichever config is active."""
+        first = ConfigData()
+        first.oidc.providers = {"test": oidc_provider_config}
+        second = ConfigData()
+        second.oidc.providers = {}
+
+        with with_context(config_override=first):
+            assert lookup_config_by_issuer(oidc_provider_config.issuer) == oidc_provider_config
+            assert lookup_config_by_issuer(oidc_provider_config.issuer + "/") == oidc_provider_config
+            assert lookup_config_by_issuer("https://unknown.issuer") is None
+
+        with with_context(config_override=second):
+            assert lookup_config_by_issuer(oidc_provider_config.issuer) is None
+
+    def test_lookup_config_by_issuer_follows_in_place_changes(
+        self, oidc_provider_config
+    ):
+        """Should notice providers replaced or re-issued within the same config."""
         test_config = ConfigData()
-        test_config.jwt.claims.user_id = "missing_claim"
+        test_config.oidc.providers = {"test": oidc_provider_config}
 
         with with_context(config_override=test_config):
-            result = extract_uid(claims)
-            assert result == "https://issuer.example|user-456"
-
-    def test_extract_scopes_from_string(self):
-        """Should parse space-separated scope string."""
-        claims = {"scope": "read write admin"}
-
-        result = extract_scopes(claims)
-        assert result == ["read", "write", "admin"]
-
-    def test_extract_scopes_from_list(self):
-        """Should handle scope as list."""
-        claims = {"scp": ["read", "write"]}
-
-        result = extract_scopes(claims)
-        assert result == ["read", "write"]
-
-    def test_extract_scopes_from_multiple_sources(self):
-        """Should combine scopes from multiple claim sources."""
-        claims = {"scope": "read write", "scp": ["admin"]}
-
-        result = extract_scopes(claims)
-        assert result == ["read", "write", "admin"]
-
-    def test_extract_roles_from_string(self):
-        """Should parse space-separated roles string."""
-        claims = {"roles": "user admin"}
-
-        result = extract_roles(claims)
-        assert set(result) == {"user", "admin"}
-
-    def test_extract_roles_from_realm_access(self):
-        """Should extract roles from Keycloak-style realm_access."""
-        claims = {"realm_access": {"roles": ["admin", "user"]}, "roles": "guest"}
-
-        result = extract_roles(claims)
-        # Convert to set for comparison since order doesn't matter
-        assert set(result) == {"admin", "user", "guest"}
-
-    def test_extract_roles_from_singular_role_claim(self):
-        """Should extract roles from singular 'role' claim."""
-        # Test single role as string
-        claims1 = {"role": "admin"}
-        result1 = extract_roles(claims1)
-        assert result1 == ["admin"]
-
-        # Test multiple roles in singular claim (space-separated)
-        claims2 = {"role": "user moderator"}
-        result2 = extract_roles(claims2)
-        assert set(result2) == {"user", "moderator"}
-
-        # Test role and roles together (should combine both)
-        claims3 = {"role": "admin", "roles": ["user", "guest"]}
-        result3 = extract_roles(claims3)
-        assert set(result3) == {"admin", "user", "guest"}
-
-    def test_extract_empty_claims(self):
-        """Should handle missing or empty claims gracefully."""
-        claims = {}
-
-        assert extract_uid(claims) == "None|None"
-        assert extract_scopes(claims) == []
-        assert extract_roles(claims) == []
-
+            providers = get_config().oidc.providers
+            assert lookup_config_by_issuer(oidc_provider_config.issuer) is not None
+
+            # Replace the provider under the same name
+            replacement = oidc_provider_config.model_copy(
+                update={"issuer": "https://replacement.issuer"}
+            )
+            providers["test"] = replacement
+            assert lookup_config_by_issuer("https://replacement.issuer") is replacement
+            assert lookup_config_by_issuer(oidc_provider_config.issuer) is None
+
+            # Change the issuer of the provider in place
+            replacement.issuer = "https://moved.issuer"
+            assert lookup_config_by_issuer("https://moved.issuer") is replacement
+            assert lookup_config_by_issuer("https://replacement.issuer") is None
 
     def test_create_token_claims_preserves_unmapped_claims(self):
         """Should preserve unmapped claims in custom_claims without dropping standard claims."""
@@ -84,6 +84,7 @@ class TestInMemorySessionStorage:
 
         await self.storage.delete("delete-session")
         assert not await self.storage.exists("delete-session")
+        assert self.storage._expiry_heap == []
 
     @pytest.mark.asyncio
     async def test_exists(self):
@@ -125,6 +126,100 @@ class TestInMemorySessionStorage:
         assert not await self.storage.exists("short-session")
         assert await self.storage.exists("long-session")
 
+    @pytest.mark.asyncio
+    async def test_cleanup_skips_overwritten_entries(self):
+        """Test that a stale expiry entry does not evict a refreshed session."""
+        session = MockSession(id="refresh", data="data", created_at=0)
+
+        with patch("time.time", return_value=1000.0):
+            await self.storage.set("refresh-session", session, 1)
+            await self.storage.set("refresh-session", session, 60)
+
+        with patch("time.time", return_value=1002.0):
+            assert await self.storage.cleanup_expired() == 0
+            assert await self.storage.exists("refresh-session")
+
+        with patch("time.time", return_value=1061.0):
+            assert await self.storage.cleanup_expired() == 1
+            assert self.storage._expiry_heap == []
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_stays_bounded_on_refresh(self):
+        """Test that refreshing one session repeatedly doesn't grow the heap."""
+        session = MockSession(id="refresh", data="data", created_at=0)
+
+        for _ in range(1000):
+            await self.storage.set("refresh-session", session, 3600)
+
+        assert len(self.storage._expiry_heap) <= 2
+        assert await self.storage.exists("refresh-session")
+
+    @pytest.mark.asyncio
+    async def test_list_keys_drops_expired_sessions(self):
+        """Test that listing keys skips and evicts expired sessions."""
+        session = MockSession(id="list", data="data", created_at=0)
+
+        with patch("time.time", return_value=1000.0):
+            await self.storage.set("user:expired", session, 1)
+            await self.storage.set("user:live", session, 60)
+            await self.storage.set("auth:live", session, 60)
+
+        with patch("time.time", return_value=1010.0):
+            assert await self.storage.list_keys("user:*") == ["user:live"]
+
+        assert "user:expired" not in self.storage._data
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_when_full(self):
+        """Test that the store stays within capacity by dropping the LRU entry."""
+        storage = InMemorySessionStorage(max_sessions=2)
+        session = MockSession(id="lru", data="data", created_at=0)
+
+        await storage.set("a", session, 60)
+        await storage.set("b", session, 60)
+        # Touch "a" so "b" becomes the least recently used entry
+        assert await storage.get("a", MockSession) is not None
+        await storage.set("c", session, 60)
+
+        assert await storage.exists("a")
+        assert not await storage.exists("b")
+        assert await storage.exists("c")
+
+        # Evicted sessions don't leave their expiry entries behind
+        for i in range(100):
+            await storage.set(f"extra-{i}", session, 60)
+        assert len(storage._data) == 2
+        assert len(storage._expiry_heap) <= 4
+
+    @pytest.mark.asyncio
+    async def test_sweeper_wakes_for_earliest_expiry(self, monkeypatch):
+        """Test the sweeper evicts a session once its expiry arrives."""
+        monkeypatch.setattr(
+            "src.app.core.storage.session_storage.MIN_SWEEP_INTERVAL_SECONDS", 0
+        )
+        now = 1000.0
+        monkeypatch.setattr("time.time", lambda: now)
+        session = MockSession(id="sweep", data="data", created_at=0)
+
+        await self.storage.set("long", session, 60)
+        self.storage.start()
+        try:
+            # Let the sweeper go to sleep until the long expiry
+            await asyncio.sleep(0)
+
+            # Pushing an earlier expiry must reschedule the sleeping sweeper
+            await self.storage.set("short", session, 1)
+            now = 1002.0
+            for _ in range(10):
+                await asyncio.sleep(0)
+                if "short" not in self.storage._data:
+                    break
+
+            assert "short" not in self.storage._data
+            assert "long" in self.storage._data
+        finally:
+            await self.storage.close()
+
     def test_is_available(self):
         """Test availability check."""
         assert self.storage.is_available() is True
@@ -133,10 +228,8 @@ class TestInMemorySessionStorage:
     async def test_corrupted_data_handling(self):
         """Test handling of corrupted session data."""
         # Manually corrupt data
-        self.storage._data["corrupted"] = {
-            "data": {"invalid": "structure"},  # Missing required fields
-            "expires_at": time.time() + 60,
-        }
+        self.storage._data["corrupted"] = {"invalid": "structure"}  # Missing fields
+        self.storage._expires_at["corrupted"] = time.time() + 60
 
         # Should return None and clean up corrupted data
         result = await self.storage.get("corrupted", MockSession)
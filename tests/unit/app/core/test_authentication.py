@@ -16,141 +16,96 @@ Replaces:
 - Various other auth-related tests
 """
 
-from unittest.mock import Mock
+from collections.abc import Set
+from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException, Request
 
 from src.app.api.http.deps import require_role, require_scope
 
+_ALL_SCOPES = frozenset({"read", "write", "admin"})
+_ONLY_READ = frozenset({"read"})
+_ALL_ROLES = frozenset({"user", "admin", "moderator"})
+_ONLY_USER = frozenset({"user"})
+_EMPTY: frozenset[str] = frozenset()
+
 
 class TestAuthenticationDependencies:
     """Test authentication and authorization dependency functions."""
 
     def create_mock_request(
-        self, scopes: list[str] | None = None, roles: list[str] | None = None
+        self, scopes: Set[str] | None = None, roles: Set[str] | None = None
     ) -> Request:
-        """Create mock request with auth context."""
-        request = Mock(spec=Request)
-        request.state = Mock()
+        """Create a stub request with auth context.
 
+        The dependencies only read ``request.state``, so a plain namespace
+        stands in for the request; omitted scopes/roles stay unset.
+        """
+        state = SimpleNamespace()
         if scopes is not None:
-            request.state.scopes = set(scopes)
+            state.scopes = scopes
         if roles is not None:
-            request.state.roles = set(roles)
-
-        return request
-
-    @pytest.mark.asyncio
-    async def test_require_scope_success(self):
-        """Test scope requirement with valid scope."""
-        request = self.create_mock_request(scopes=["read", "write", "admin"])
-
-        scope_dep = require_scope("read")
-        # Should not raise for valid scope
-        await scope_dep(request)
-
-        scope_dep_write = require_scope("write")
-        await scope_dep_write(request)
-
+            state.roles = roles
+
+        return SimpleNamespace(state=state)  # type: ignore[return-value]
+
+    @pytest.mark.parametrize(
+        ("scopes", "required", "allowed"),
+        [
+            (_ALL_SCOPES, "read", True),
+            (_ALL_SCOPES, "write", True),
+            (_ONLY_READ, "admin", False),
+            (_EMPTY, "read", False),
+            (None, "read", False),
+        ],
+        ids=["has-read", "has-write", "missing", "empty", "no-attribute"],
+    )
     @pytest.mark.asyncio
-    async def test_require_scope_failure(self):
-        """Test scope requirement with missing scope."""
-        request = self.create_mock_request(scopes=["read"])
-
-        scope_dep = require_scope("admin")
+    async def test_require_scope(self, scopes, required, allowed):
+        """Test scope requirement across granted, missing and absent scopes."""
+        request = self.create_mock_request(scopes=scopes)
+        scope_dep = require_scope(required)
 
-        with pytest.raises(HTTPException) as exc_info:
+        if allowed:
             await scope_dep(request)
-
-        assert exc_info.value.status_code == 403
-        assert "Missing required scope: admin" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_require_scope_empty_scopes(self):
-        """Test scope requirement with empty scopes set."""
-        request = self.create_mock_request(scopes=[])
-
-        scope_dep = require_scope("read")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await scope_dep(request)
-
-        assert exc_info.value.status_code == 403
-        assert "Missing required scope: read" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_require_scope_missing_scopes_attribute(self):
-        """Test scope requirement when scopes attribute is missing from state."""
-        request = Mock(spec=Request)
-
-        # Create a simple object without the scopes attribute
-        class SimpleState:
-            pass
-
-        request.state = SimpleState()
-
-        scope_dep = require_scope("read")
+            return
 
         with pytest.raises(HTTPException) as exc_info:
             await scope_dep(request)
 
         assert exc_info.value.status_code == 403
-        assert "Missing required scope: read" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_require_role_success(self):
-        """Test role requirement with valid role."""
-        request = self.create_mock_request(roles=["user", "admin", "moderator"])
-
-        role_dep = require_role("admin")
-        # Should not raise for valid role
-        await role_dep(request)
-
-        role_dep_user = require_role("user")
-        await role_dep_user(request)
-
+        assert f"Missing required scope: {required}" in exc_info.value.detail
+
+    def test_dependencies_are_cached_per_name(self):
+        """Test identical scope/role names share one dependency callable."""
+        assert require_scope("read") is require_scope("read")
+        assert require_scope("read") is not require_scope("write")
+        assert require_role("admin") is require_role("admin")
+
+    @pytest.mark.parametrize(
+        ("roles", "required", "allowed"),
+        [
+            (_ALL_ROLES, "admin", True),
+            (_ALL_ROLES, "user", True),
+            (_ONLY_USER, "admin", False),
+            (_EMPTY, "user", False),
+            (None, "user", False),
+        ],
+        ids=["has-admin", "has-user", "missing", "empty", "no-attribute"],
+    )
     @pytest.mark.asyncio
-    async def test_require_role_failure(self):
-        """Test role requirement with missing role."""
-        request = self.create_mock_request(roles=["user"])
+    async def test_require_role(self, roles, required, allowed):
+        """Test role requirement across granted, missing and absent roles."""
+        request = self.create_mock_request(roles=roles)
+        role_dep = require_role(required)
 
-        role_dep = require_role("admin")
-
-        with pytest.raises(HTTPException) as exc_info:
+        if allowed:
             await role_dep(request)
-
-        assert exc_info.value.status_code == 403
-        assert "Missing required role: admin" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_require_role_empty_roles(self):
-        """Test role requirement with empty roles set."""
-        request = self.create_mock_request(roles=[])
-
-        role_dep = require_role("user")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await role_dep(request)
-
-        assert exc_info.value.status_code == 403
-        assert "Missing required role: user" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_require_role_missing_roles_attribute(self):
-        """Test role requirement when roles attribute is missing from state."""
-        request = Mock(spec=Request)
-
-        # Create a simple object without the roles attribute
-        class SimpleState:
-            pass
-
-        request.state = SimpleState()
-
-        role_dep = require_role("user")
+            return
 
         with pytest.raises(HTTPException) as exc_info:
             await role_dep(request)
 
         assert exc_info.value.status_code == 403
-        assert "Missing required role: user" in exc_info.value.detail
+        assert f"Missing required role: {required}" in exc_info.value.detail
@@ -0,0 +1,36 @@
+"""Tests for the coarse expiry clock."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.app.core import clock
+
+
+class TestCoarseClock:
+    """Test ticked clock reads and deadline checks."""
+
+    def test_current_time_tracks_wall_clock(self):
+        """The ticked time should trail the wall clock by at most one tick."""
+        before = int(time.time())
+        now = clock.current_time()
+        assert before - clock.TICK_SECONDS - 1 <= now <= time.time()
+
+    @pytest.mark.parametrize(
+        ("offset", "expected"),
+        [(-100, True), (-1, True), (1, False), (100, False)],
+    )
+    def test_has_passed_matches_time_time(self, offset, expected):
+        """Deadlines on either side of now should match time.time() > deadline."""
+        deadline = time.time() + offset
+        assert clock.has_passed(deadline) is expected
+
+    def test_has_passed_rechecks_near_deadline(self, monkeypatch):
+        """A deadline within the lag window should be re-read from time.time()."""
+        monkeypatch.setattr(clock, "current_time", lambda: 1000)
+
+        with patch("time.time", return_value=1001.5):
+            assert clock.has_passed(1001)
+        with patch("time.time", return_value=1000.5):
+            assert not clock.has_passed(1001)
@@ -14,8 +14,13 @@ Replaces:
 - tests/unit/core/test_repositories.py (using real database instead of mocks)
 """
 
+import re
+from collections.abc import Generator
+from datetime import UTC, datetime
+
 import pytest
-from sqlmodel import Session, select
+from sqlalchemy import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from src.app.entities.core.user import User, UserRepository, UserTable
 from src.app.entities.core.user_identity import (
@@ -24,6 +29,23 @@ from src.app.entities.core.user_identity import (
     UserIdentityTable,
 )
 
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+# Fixed timestamp for conversion tests, so they don't depend on the clock
+_FIXED_DT = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+# Column values for identity table rows. Rows themselves are built per test:
+# a table instance binds to the session it is added to, so it can't be shared.
+_IDENTITY_ROW = {
+    "id": "user1-id",
+    "issuer": "https://auth.example.com",
+    "subject": "unique-user-123",
+    "uid_claim": "auth.example.com|unique-user-123",
+    "user_id": "user-uuid-123",
+}
+
 
 class TestUserEntity:
     """Test User domain entity."""
@@ -86,17 +108,35 @@ class TestUserEntity:
         # Test equality with same business data (should ignore timestamp differences)
         assert user1 == user2
         assert user1 != user3
+        assert hash(user1) == hash(user2)
+
+    def test_user_hash_stable_across_profile_edits(self):
+        """Should keep the same hash when non-identifying fields change."""
+        user = User(id="1", first_name="John", last_name="Doe")
+        before = hash(user)
+
+        user.email = "john.doe@example.com"
+
+        assert hash(user) == before
+        assert user in {user}
 
     def test_user_representation(self):
-        """Should have a meaningful string representation."""
+        """Should expose its identifying fields for representation."""
         user = User(
             id="1", first_name="John", last_name="Doe", email="john.doe@example.com"
         )
 
-        user_str = str(user)
-        assert "John" in user_str
-        assert "Doe" in user_str
-        assert "john.doe@example.com" in user_str
+        values = user.model_dump().values()
+        assert "John" in values
+        assert "Doe" in values
+        assert "john.doe@example.com" in values
+
+    def test_user_str(self):
+        """str() should give a short name/email form."""
+        user = User(first_name="John", last_name="Doe", email="john.doe@example.com")
+
+        assert str(user) == "User(John Doe <john.doe@example.com>)"
+        assert str(User(first_name="Jane", last_name="Roe")) == "User(Jane Roe)"
 
     def test_user_creation_with_defaults(self):
         """User should be created with auto-generated UUID."""
@@ -105,9 +145,8 @@ class TestUserEntity:
         # ID should be auto-generated
         assert user.id is not None
         assert isinstance(user.id, str)
-        # Should be a valid UUID string
-        from uuid import UUID
-        UUID(user.id)  # Raises ValueError if invalid
+        # Should be a canonical UUID string
+        assert _UUID_RE.fullmatch(user.id)
 
         # Other fields should be set
         assert user.first_name == "Test"
@@ -165,25 +204,23 @@ class TestUserEntity:
         assert user.first_name == ""
         assert user.last_name == ""
 
-    def test_user_with_extreme_values(self):
+    @pytest.mark.parametrize(
+        ("first_name", "last_name", "email"),
+        [
+            # Very long strings
+            ("A" * 1000, "Test", "long.name@example.com"),
+            # Special characters and unicode (Japanese last name)
+            ("José", "山田", "josé.yamada@example.com"),
+        ],
+        ids=["long", "unicode"],
+    )
+    def test_user_with_extreme_values(self, first_name, last_name, email):
         """Test user entity with boundary and edge case values."""
-        # Test very long strings
-        long_name = "A" * 1000
-        user = User(
-            first_name=long_name,
-            last_name="Test",
-            email="long.name@example.com",
-        )
-        assert user.first_name == long_name
+        user = User(first_name=first_name, last_name=last_name, email=email)
 
-        # Test special characters and unicode
-        user_unicode = User(
-            first_name="José",
-            last_name="山田",  # Japanese characters
-            email="josé.yamada@example.com",
-        )
-        assert user_unicode.first_name == "José"
-        assert user_unicode.last_name == "山田"
+        assert user.first_name == first_name
+        assert user.last_name == last_name
+        assert user.email == email
 
     def test_user_with_null_and_empty_values(self):
         """Test user entity with various null/empty combinations."""
@@ -259,7 +296,13 @@ class TestUserTable:
 
     def test_table_model_from_entity(self):
         """UserTable should be created from User entity."""
-        user = User(first_name="Test", last_name="User", email="test@example.com")
+        user = User(
+            first_name="Test",
+            last_name="User",
+            email="test@example.com",
+            created_at=_FIXED_DT,
+            updated_at=_FIXED_DT,
+        )
 
         table = UserTable.model_validate(user, from_attributes=True)
 
@@ -267,9 +310,10 @@ class TestUserTable:
         assert table.first_name == user.first_name
         assert table.last_name == user.last_name
         assert table.email == user.email
+        assert table.created_at == table.updated_at == _FIXED_DT
 
     def test_entity_from_table_model(self):
-        """User entity should be created from UserTable."""
+        """User entity should be created from UserTable via Entity.from_row."""
         table = UserTable(
             id="test-id",
             first_name="Test",
@@ -277,14 +321,18 @@ class TestUserTable:
             email="test@example.com",
             phone=None,
             address=None,
+            created_at=_FIXED_DT,
+            updated_at=_FIXED_DT,
         )
 
-        user = User.model_validate(table, from_attributes=True)
+        user = User.from_row(table)
 
+        assert isinstance(user, User)
         assert user.id == table.id
         assert user.first_name == table.first_name
         assert user.last_name == table.last_name
         assert user.email == table.email
+        assert user.created_at == user.updated_at == _FIXED_DT
 
 
 class TestUserRepository:
@@ -309,6 +357,21 @@ class TestUserRepository:
         assert created_user.first_name == "Repository"
         assert created_user.email == "repo.test@example.com"
 
+    def test_create_many_users(self, session: Session, user_repo: UserRepository):
+        """Test creating several users in one batch."""
+        users = [User(first_name=f"Bulk{i}", last_name="Import") for i in range(3)]
+
+        created = user_repo.create_many(users)
+        session.commit()
+
+        assert created == users
+        found = user_repo.get_many(user.id for user in users)
+        assert [found[user.id].first_name for user in users] == [
+            "Bulk0",
+            "Bulk1",
+            "Bulk2",
+        ]
+
     def test_get_user_by_id(self, user_repo: UserRepository):
         """Test retrieving user by ID."""
         # Create user first
@@ -331,6 +394,18 @@ class TestUserRepository:
         result = user_repo.get("nonexistent-id")
         assert result is None
 
+    def test_get_many_users(self, user_repo: UserRepository):
+        """Test retrieving several users by ID in one call."""
+        first = user_repo.create(User(first_name="First", last_name="Many"))
+        second = user_repo.create(User(first_name="Second", last_name="Many"))
+
+        found = user_repo.get_many([first.id, second.id, "nonexistent-id"])
+
+        assert set(found) == {first.id, second.id}
+        assert found[first.id].first_name == "First"
+        assert found[second.id].first_name == "Second"
+        assert user_repo.get_many([]) == {}
+
     def test_update_user(self, user_repo: UserRepository):
         """Test updating user through repository."""
         # Create user
@@ -401,6 +476,34 @@ class TestUserRepository:
         assert retrieved_after.first_name == "Updated Transaction"
         assert retrieved_after.id == created_user.id
 
+    def test_get_by_identity(self, session: Session, user_repo: UserRepository):
+        """Test resolving a user through its identity by uid or issuer/subject."""
+        by_uid = user_repo.create(User(first_name="Uid", last_name="Match"))
+        by_sub = user_repo.create(User(first_name="Sub", last_name="Match"))
+        identity_repo = UserIdentityRepository(session)
+        identity_repo.create(
+            UserIdentity(
+                issuer="https://a.example",
+                subject="a-1",
+                uid_claim="shared-uid",
+                user_id=by_uid.id,
+            )
+        )
+        identity_repo.create(
+            UserIdentity(
+                issuer="https://b.example", subject="b-1", user_id=by_sub.id
+            )
+        )
+
+        found = user_repo.get_by_identity("https://b.example", "b-1")
+        assert found is not None and found.id == by_sub.id
+
+        # A uid match takes precedence over an issuer/subject match
+        found = user_repo.get_by_identity("https://b.example", "b-1", "shared-uid")
+        assert found is not None and found.id == by_uid.id
+
+        assert user_repo.get_by_identity("https://c.example", "c-1", "none") is None
+
 
 class TestUserIdentityEntity:
     """Test UserIdentity domain entity."""
@@ -441,13 +544,7 @@ class TestUserIdentityTable:
 
     def test_user_identity_table_creation(self, session: Session):
         """Test creating user identity table records."""
-        identity_table = UserIdentityTable(
-            id="test-id",
-            issuer="https://db.auth.example.com",
-            subject="db-user-123",
-            uid_claim="db.auth.example.com|db-user-123",
-            user_id="db-user-uuid-123",
-        )
+        identity_table = UserIdentityTable(**_IDENTITY_ROW)
 
         session.add(identity_table)
         session.commit()
@@ -455,29 +552,19 @@ class TestUserIdentityTable:
         # Verify it was saved
         saved_identity = session.get(UserIdentityTable, identity_table.id)
         assert saved_identity is not None
-        assert saved_identity.issuer == "https://db.auth.example.com"
-        assert saved_identity.subject == "db-user-123"
+        assert saved_identity.issuer == _IDENTITY_ROW["issuer"]
+        assert saved_identity.subject == _IDENTITY_ROW["subject"]
 
     def test_user_identity_table_unique_constraints(self, session: Session):
         """Test unique constraints on user identity table."""
         # Create first identity
-        identity1 = UserIdentityTable(
-            id="user1-id",
-            issuer="https://auth.example.com",
-            subject="unique-user-123",
-            uid_claim="auth.example.com|unique-user-123",
-            user_id="user-uuid-123",
-        )
+        identity1 = UserIdentityTable(**_IDENTITY_ROW)
         session.add(identity1)
         session.commit()
 
         # Try to create duplicate identity (same issuer + subject)
         identity2 = UserIdentityTable(
-            id="user2-id",
-            issuer="https://auth.example.com",
-            subject="unique-user-123",  # Same subject
-            uid_claim="auth.example.com|unique-user-123",
-            user_id="user-uuid-456",  # Different user
+            **{**_IDENTITY_ROW, "id": "user2-id", "user_id": "user-uuid-456"}
         )
         session.add(identity2)
 
@@ -490,10 +577,35 @@ class TestUserIdentityTable:
 class TestUserIdentityRepository:
     """Test UserIdentity repository operations."""
 
+    @pytest.fixture(scope="class")
+    def class_session(self) -> Generator[Session]:
+        """One in-memory database shared by the tests in this class."""
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(engine)
+
+        with Session(engine) as session:
+            try:
+                yield session
+            finally:
+                session.close()
+                engine.dispose()
+
+    @pytest.fixture(scope="class")
+    def shared_identity_repo(self, class_session: Session) -> UserIdentityRepository:
+        """Repository built once per class over the shared session."""
+        return UserIdentityRepository(class_session)
+
     @pytest.fixture
-    def identity_repo(self, session: Session) -> UserIdentityRepository:
-        """User identity repository instance."""
-        return UserIdentityRepository(session)
+    def identity_repo(
+        self, class_session: Session, shared_identity_repo: UserIdentityRepository
+    ) -> Generator[UserIdentityRepository]:
+        """User identity repository; each test's writes are rolled back."""
+        yield shared_identity_repo
+        class_session.rollback()
 
     def test_create_user_identity(self, identity_repo: UserIdentityRepository):
         """Test creating user identity through repository."""
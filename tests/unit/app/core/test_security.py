@@ -1,11 +1,12 @@
 """Tests for security utilities."""
 
-import time
-from unittest.mock import patch
+import hashlib
+import hmac
 
 import pytest
 
 from src.app.core.security import (
+    CSRF_WINDOW_SHIFT,
     generate_csrf_token,
     generate_nonce,
     generate_pkce_pair,
@@ -16,6 +17,31 @@ from src.app.core.security import (
     validate_client_fingerprint,
     validate_csrf_token,
 )
+from src.app.runtime.context import get_config
+
+
+@pytest.fixture
+def csrf_secret(monkeypatch):
+    """Pin the CSRF signing secret on the active config for one test."""
+
+    def _set(secret: str) -> None:
+        monkeypatch.setattr(get_config().app, "csrf_signing_secret", secret)
+
+    return _set
+
+
+@pytest.fixture
+def csrf_clock(monkeypatch):
+    """Pin the clock seen by CSRF generation and validation for one test."""
+
+    def _set(now: int) -> None:
+        monkeypatch.setattr("src.app.core.security.current_time", lambda: now)
+
+    return _set
+
+
+# An arbitrary wall-clock time a few seconds into a CSRF window
+NOW = (1_800_000_000 >> CSRF_WINDOW_SHIFT << CSRF_WINDOW_SHIFT) + 5
 
 
 class TestTokenGeneration:
@@ -99,45 +125,51 @@ class TestTokenGeneration:
 class TestCSRFTokens:
     """Test CSRF token generation and validation."""
 
-    def test_generate_csrf_token(self):
+    def test_generate_csrf_token(self, csrf_secret):
         """Test CSRF token generation."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret"
-            
-            token = generate_csrf_token("session-123")
-            
-            assert isinstance(token, str)
-            assert ':' in token  # Should contain timestamp
-            
-            # Should be deterministic for same inputs
-            token2 = generate_csrf_token("session-123")
-            assert token == token2
-
-    def test_generate_csrf_token_custom_timestamp(self):
+        csrf_secret("test-secret")
+
+        token = generate_csrf_token("session-123")
+
+        assert isinstance(token, str)
+        assert ':' in token  # Should contain timestamp
+
+        # Should be deterministic for same inputs
+        token2 = generate_csrf_token("session-123")
+        assert token == token2
+
+    def test_generate_csrf_token_custom_timestamp(self, csrf_secret):
         """Test CSRF token with custom timestamp."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret"
-            
-            token1 = generate_csrf_token("session-123", 1000)
-            token2 = generate_csrf_token("session-123", 2000)
-            
-            assert token1 != token2
-
-    def test_validate_csrf_token_success(self):
+        csrf_secret("test-secret")
+
+        token1 = generate_csrf_token("session-123", 1000)
+        token2 = generate_csrf_token("session-123", 2000)
+
+        assert token1 != token2
+
+    def test_generate_csrf_token_follows_secret(self, csrf_secret):
+        """Test tokens are plain HMAC-SHA256 under the current secret."""
+        for secret in ("first-secret", "second-secret"):
+            csrf_secret(secret)
+            expected = hmac.new(
+                secret.encode(), b"session-123:1000", hashlib.sha256
+            ).hexdigest()
+
+            assert generate_csrf_token("session-123", 1000) == f"1000:{expected}"
+
+    def test_validate_csrf_token_success(self, csrf_secret):
         """Test successful CSRF token validation."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret"
-            
-            token = generate_csrf_token("session-123")
-            assert validate_csrf_token("session-123", token) is True
+        csrf_secret("test-secret")
+
+        token = generate_csrf_token("session-123")
+        assert validate_csrf_token("session-123", token) is True
 
-    def test_validate_csrf_token_wrong_session(self):
+    def test_validate_csrf_token_wrong_session(self, csrf_secret):
         """Test CSRF token validation with wrong session."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret"
-            
-            token = generate_csrf_token("session-123")
-            assert validate_csrf_token("session-456", token) is False
+        csrf_secret("test-secret")
+
+        token = generate_csrf_token("session-123")
+        assert validate_csrf_token("session-456", token) is False
 
     def test_validate_csrf_token_none(self):
         """Test CSRF token validation with None token."""
@@ -148,31 +180,66 @@ class TestCSRFTokens:
         assert validate_csrf_token("session-123", "invalid") is False
         assert validate_csrf_token("session-123", "no-colon") is False
 
-    def test_validate_csrf_token_expired(self):
+    def test_validate_csrf_token_non_ascii(self, csrf_secret):
+        """Test CSRF token validation rejects non-ASCII signatures."""
+        csrf_secret("test-secret")
+
+        timestamp = generate_csrf_token("session-123").split(":", 1)[0]
+        assert validate_csrf_token("session-123", f"{timestamp}:sigñature") is False
+
+    def test_validate_csrf_token_expired(self, csrf_secret, csrf_clock):
         """Test CSRF token validation with expired token."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret"
-            
-            # Generate token from 25 hours ago
-            old_timestamp = int(time.time() // 3600) - 25
-            token = generate_csrf_token("session-123", old_timestamp)
-            
-            assert validate_csrf_token("session-123", token, max_age_hours=24) is False
-
-    def test_validate_csrf_token_custom_max_age(self):
+        csrf_secret("test-secret")
+        csrf_clock(NOW)
+
+        # 23 windows is well past 24 hours
+        old_timestamp = (NOW >> CSRF_WINDOW_SHIFT) - 23
+        token = generate_csrf_token("session-123", old_timestamp)
+
+        assert validate_csrf_token("session-123", token, max_age_hours=24) is False
+
+    def test_validate_csrf_token_custom_max_age(self, csrf_secret, csrf_clock):
         """Test CSRF token validation with custom max age."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret"
-            
-            # Generate token from 2 hours ago
-            old_timestamp = int(time.time() // 3600) - 2
-            token = generate_csrf_token("session-123", old_timestamp)
-            
-            # Should fail with 1 hour max age
-            assert validate_csrf_token("session-123", token, max_age_hours=1) is False
-            
-            # Should pass with 3 hour max age
-            assert validate_csrf_token("session-123", token, max_age_hours=3) is True
+        csrf_secret("test-secret")
+        csrf_clock(NOW)
+
+        # Token from 2 windows ago (about 2.3 hours)
+        old_timestamp = (NOW >> CSRF_WINDOW_SHIFT) - 2
+        token = generate_csrf_token("session-123", old_timestamp)
+
+        # Should fail with 1 hour max age
+        assert validate_csrf_token("session-123", token, max_age_hours=1) is False
+
+        # Should pass with 3 hour max age
+        assert validate_csrf_token("session-123", token, max_age_hours=3) is True
+
+    def test_validate_csrf_token_across_window_boundary(self, csrf_secret, csrf_clock):
+        """Test a token issued just before a window boundary survives it."""
+        csrf_secret("test-secret")
+        csrf_clock(NOW - 10)
+        token = generate_csrf_token("session-123")
+
+        csrf_clock(NOW)
+        assert validate_csrf_token("session-123", token, max_age_hours=1) is True
+
+    def test_validate_csrf_token_next_window(self, csrf_secret, csrf_clock):
+        """Test a token from a worker one window ahead is accepted."""
+        csrf_secret("test-secret")
+        csrf_clock(NOW)
+        token = generate_csrf_token("session-123")
+
+        csrf_clock(NOW - 10)
+        assert validate_csrf_token("session-123", token) is True
+
+    def test_validate_csrf_token_future_window(self, csrf_secret, csrf_clock):
+        """Test CSRF token validation rejects tokens stamped further ahead."""
+        csrf_secret("test-secret")
+        csrf_clock(NOW)
+
+        future_timestamp = (NOW >> CSRF_WINDOW_SHIFT) + 2
+        token = generate_csrf_token("session-123", future_timestamp)
+
+        assert validate_csrf_token("session-123", token) is False
 
 
 class TestReturnUrlSanitization:
@@ -308,24 +375,23 @@ class TestClientFingerprinting:
 class TestSecurityUtilsIntegration:
     """Integration tests for security utilities."""
 
-    def test_full_csrf_flow(self):
+    def test_full_csrf_flow(self, csrf_secret):
         """Test complete CSRF token generation and validation flow."""
-        with patch('src.app.runtime.context.get_config') as mock_config:
-            mock_config.return_value.app.session_signing_secret = "test-secret-key"
-            
-            session_id = "user-session-abc123"
-            
-            # Generate token
-            csrf_token = generate_csrf_token(session_id)
-            
-            # Should validate immediately
-            assert validate_csrf_token(session_id, csrf_token) is True
-            
-            # Should not validate for different session
-            assert validate_csrf_token("different-session", csrf_token) is False
-            
-            # Should not validate None
-            assert validate_csrf_token(session_id, None) is False
+        csrf_secret("test-secret-key")
+
+        session_id = "user-session-abc123"
+
+        # Generate token
+        csrf_token = generate_csrf_token(session_id)
+
+        # Should validate immediately
+        assert validate_csrf_token(session_id, csrf_token) is True
+
+        # Should not validate for different session
+        assert validate_csrf_token("different-session", csrf_token) is False
+
+        # Should not validate None
+        assert validate_csrf_token(session_id, None) is False
 
     def test_full_fingerprint_flow(self):
         """Test complete client fingerprinting flow."""
@@ -4,7 +4,21 @@ Tests the start_activity() and execute_activity() methods that track in-flight
 activities for cancellation support.
 """
 
-import pytest
+import inspect
+
+from temporalio import workflow as _tw
+
+from src.app.worker.workflows.base import BaseWorkflow
+
+# Resolve the (expensive) signatures once per process; tests only compare sets.
+_TEMP_START_PARAMS = frozenset(inspect.signature(_tw.start_activity).parameters)
+_TEMP_EXEC_PARAMS = frozenset(inspect.signature(_tw.execute_activity).parameters)
+_BASE_START_PARAMS = frozenset(
+    inspect.signature(BaseWorkflow.start_activity).parameters
+) - {"self"}
+_BASE_EXEC_PARAMS = frozenset(
+    inspect.signature(BaseWorkflow.execute_activity).parameters
+) - {"self"}
 
 
 class TestBaseWorkflowActivityMethods:
@@ -12,21 +26,15 @@ class TestBaseWorkflowActivityMethods:
 
     def test_base_workflow_has_start_activity_method(self):
         """Test BaseWorkflow has start_activity instance method."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         assert hasattr(BaseWorkflow, "start_activity")
         # Note: Can't test callable directly since it's on abstract class
 
     def test_base_workflow_has_execute_activity_method(self):
         """Test BaseWorkflow has execute_activity instance method."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         assert hasattr(BaseWorkflow, "execute_activity")
 
     def test_base_workflow_tracks_activity_handles(self):
         """Test BaseWorkflow initializes activity handle tracking."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         # Create a concrete implementation for testing
         class TestWorkflow(BaseWorkflow[str, str]):
             async def run(self, input: str) -> str:
@@ -36,7 +44,7 @@ class TestBaseWorkflowActivityMethods:
 
         # Verify tracking data structures exist
         assert hasattr(workflow, "_activity_handles")
-        assert isinstance(workflow._activity_handles, dict)
+        assert type(workflow._activity_handles) is dict
         assert len(workflow._activity_handles) == 0
 
         assert hasattr(workflow, "_activity_counter")
@@ -44,10 +52,6 @@ class TestBaseWorkflowActivityMethods:
 
     def test_start_activity_signature(self):
         """Test start_activity has the expected signature with all Temporal parameters."""
-        import inspect
-
-        from src.app.worker.workflows.base import BaseWorkflow
-
         sig = inspect.signature(BaseWorkflow.start_activity)
         params = list(sig.parameters.keys())
 
@@ -66,10 +70,6 @@ class TestBaseWorkflowActivityMethods:
 
     def test_execute_activity_signature(self):
         """Test execute_activity has the expected signature with all Temporal parameters."""
-        import inspect
-
-        from src.app.worker.workflows.base import BaseWorkflow
-
         sig = inspect.signature(BaseWorkflow.execute_activity)
         params = list(sig.parameters.keys())
 
@@ -88,25 +88,15 @@ class TestBaseWorkflowActivityMethods:
 
     def test_execute_activity_is_async(self):
         """Test execute_activity is an async method."""
-        import inspect
-
-        from src.app.worker.workflows.base import BaseWorkflow
-
         assert inspect.iscoroutinefunction(BaseWorkflow.execute_activity)
 
     def test_start_activity_is_not_async(self):
         """Test start_activity is a regular method (returns handle, not awaitable)."""
-        import inspect
-
-        from src.app.worker.workflows.base import BaseWorkflow
-
         # start_activity should NOT be async - it returns an ActivityHandle
         assert not inspect.iscoroutinefunction(BaseWorkflow.start_activity)
 
     def test_cancel_signal_implementation(self):
         """Test cancel signal sets state and would cancel activities."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         # Create a concrete implementation for testing
         class TestWorkflow(BaseWorkflow[str, str]):
             async def run(self, input: str) -> str:
@@ -122,39 +112,15 @@ class TestBaseWorkflowActivityMethods:
 
     def test_start_activity_signature_matches_temporal(self):
         """Test start_activity signature matches Temporal's workflow.start_activity."""
-        import inspect
-
-        from temporalio import workflow
-
-        from src.app.worker.workflows.base import BaseWorkflow
-
-        base_sig = inspect.signature(BaseWorkflow.start_activity)
-        temporal_sig = inspect.signature(workflow.start_activity)
-
-        base_params = set(base_sig.parameters.keys()) - {"self"}
-        temporal_params = set(temporal_sig.parameters.keys())
-
         # All Temporal parameters should be in BaseWorkflow method
         # (BaseWorkflow may have additional ones like self)
-        missing_params = temporal_params - base_params
+        missing_params = _TEMP_START_PARAMS - _BASE_START_PARAMS
         assert not missing_params, f"Missing parameters from Temporal API: {missing_params}"
 
     def test_execute_activity_signature_matches_temporal(self):
         """Test execute_activity signature matches Temporal's workflow.execute_activity."""
-        import inspect
-
-        from temporalio import workflow
-
-        from src.app.worker.workflows.base import BaseWorkflow
-
-        base_sig = inspect.signature(BaseWorkflow.execute_activity)
-        temporal_sig = inspect.signature(workflow.execute_activity)
-
-        base_params = set(base_sig.parameters.keys()) - {"self"}
-        temporal_params = set(temporal_sig.parameters.keys())
-
         # All Temporal parameters should be in BaseWorkflow method
-        missing_params = temporal_params - base_params
+        missing_params = _TEMP_EXEC_PARAMS - _BASE_EXEC_PARAMS
         assert not missing_params, f"Missing parameters from Temporal API: {missing_params}"
 
 
@@ -163,24 +129,18 @@ class TestActivityTrackingDocumentation:
 
     def test_start_activity_has_docstring(self):
         """Test start_activity has docstring explaining tracking."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         assert BaseWorkflow.start_activity.__doc__ is not None
         docstring = BaseWorkflow.start_activity.__doc__
         assert "track" in docstring.lower() or "cancel" in docstring.lower()
 
     def test_execute_activity_has_docstring(self):
         """Test execute_activity has docstring explaining tracking."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         assert BaseWorkflow.execute_activity.__doc__ is not None
         docstring = BaseWorkflow.execute_activity.__doc__
         assert "track" in docstring.lower() or "cancel" in docstring.lower()
 
     def test_cancel_signal_has_docstring(self):
         """Test cancel signal has docstring explaining activity cancellation."""
-        from src.app.worker.workflows.base import BaseWorkflow
-
         assert BaseWorkflow.cancel.__doc__ is not None
         docstring = BaseWorkflow.cancel.__doc__
         assert "cancel" in docstring.lower()
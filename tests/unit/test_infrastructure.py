@@ -16,21 +16,25 @@ from fastapi.testclient import TestClient
 from src.app.runtime.context import get_config
 
 
+@pytest.fixture(scope="module")
+def app():
+    """The FastAPI application, imported once for the module."""
+    from src.app.api.http.app import app
+
+    return app
+
+
 class TestApplicationStartup:
     """Test application startup and initialization."""
 
-    def test_app_creation(self):
+    def test_app_creation(self, app):
         """Test that the FastAPI app can be created."""
-        from src.app.api.http.app import app
-
         assert app is not None
         assert hasattr(app, "routes")
         assert len(app.routes) > 0
 
-    def test_middleware_configuration(self):
+    def test_middleware_configuration(self, app):
         """Test that middleware is properly configured."""
-        from src.app.api.http.app import app
-
         # Check that middleware is applied
         middleware_types = [
             type(middleware.cls).__name__ for middleware in app.user_middleware
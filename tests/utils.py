@@ -1,5 +1,8 @@
 import base64
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
 
 from authlib.jose import jwt
 
@@ -11,3 +14,14 @@ def oct_jwk(key: bytes, kid: str) -> dict[str, str]:
         "alg": "HS256",
         "kid": kid,
     }
+
+
+@contextmanager
+def attr_snapshot(obj: Any, *names: str) -> Iterator[None]:
+    """Restore the named attributes of ``obj`` on exit."""
+    saved = {name: getattr(obj, name) for name in names}
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(obj, name, value)